@@ -0,0 +1,161 @@
+# SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+import copy
+import hashlib
+import json
+import pickle
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+DEFAULT_CACHE_MAX_SIZE = 1000
+DEFAULT_CACHE_TTL_SECONDS = 300.0
+
+
+def _hash_query(hasher: Any, query: Any) -> None:
+    """
+    Feeds `query` to `hasher`.
+
+    Lists of numbers, like embeddings, are hashed through their binary representation, which is much faster than
+    hashing their `repr`. Every part is prefixed with its kind and length so that different queries can't produce
+    the same input.
+    """
+    if isinstance(query, tuple):
+        hasher.update(b"t%d;" % len(query))
+        for part in query:
+            _hash_query(hasher, part)
+        return
+
+    if isinstance(query, list):
+        for typecode in ("q", "d"):
+            try:
+                values = array(typecode, query)
+            except (TypeError, OverflowError):
+                continue
+            hasher.update(b"%s%d;" % (typecode.encode(), len(values)))
+            hasher.update(values.tobytes())
+            return
+
+    serialized_query = repr(query).encode("utf-8")
+    hasher.update(b"r%d;" % len(serialized_query))
+    hasher.update(serialized_query)
+
+
+class QueryCache:
+    """
+    A thread-safe LRU cache with a time-to-live, used by the retrievers to store the results of their queries.
+
+    Values are copied when they are stored and when they are returned, so callers can freely modify the
+    Documents they receive without altering the cached entries. The copies are made by pickling the value once
+    when it is stored and unpickling it on every hit, which is several times faster than `copy.deepcopy`.
+    Values that can't be pickled are deep-copied instead.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_MAX_SIZE, ttl_seconds: float = DEFAULT_CACHE_TTL_SECONDS):
+        """
+        Create a QueryCache.
+
+        :param max_size: Maximum number of entries kept in the cache. The least recently used entry is evicted when
+            the cache is full.
+        :param ttl_seconds: Number of seconds after which an entry expires.
+
+        :raises ValueError: If `max_size` or `ttl_seconds` is not positive.
+        """
+        if max_size <= 0:
+            msg = "max_size must be a positive integer"
+            raise ValueError(msg)
+        if ttl_seconds <= 0:
+            msg = "ttl_seconds must be a positive number"
+            raise ValueError(msg)
+
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[bytes, Tuple[float, bool, Any]] = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @staticmethod
+    def make_key(query: Any, filters: Any, top_k: Any, *params: Any) -> bytes:
+        """
+        Builds a cache key from the inputs of a retrieval.
+
+        :param query: The query, e.g. a string or an embedding.
+        :param filters: The filters of the retrieval, serialized to JSON with sorted keys.
+        :param top_k: The maximum number of documents to return.
+        :param params: Any other parameter that influences the result of the retrieval.
+        :returns: The digest identifying the retrieval.
+        """
+        hasher = hashlib.blake2b()
+        _hash_query(hasher, query)
+        serialized_filters = json.dumps(filters, sort_keys=True, default=str)
+        hasher.update(repr((serialized_filters, top_k, params)).encode("utf-8"))
+        return hasher.digest()
+
+    def get(self, key: bytes) -> Optional[Any]:
+        """
+        Returns the value stored for `key`, or `None` if there is no valid entry for it.
+
+        :param key: The cache key, see `make_key`.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            expires_at, pickled, stored_value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                self._evictions += 1
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+
+        # Stored values are never modified, so they can be copied without holding the lock.
+        # Only bytes pickled by `put` end up here, never data coming from outside the process.
+        return pickle.loads(stored_value) if pickled else copy.deepcopy(stored_value)  # noqa: S301
+
+    def put(self, key: bytes, value: Any) -> None:
+        """
+        Stores `value` for `key`, evicting the least recently used entry if the cache is full.
+
+        :param key: The cache key, see `make_key`.
+        :param value: The value to store.
+        """
+        try:
+            pickled, stored_value = True, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            pickled, stored_value = False, copy.deepcopy(value)
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl_seconds, pickled, stored_value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """
+        Removes all the entries from the cache. The statistics are preserved.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the number of hits, misses and evictions recorded so far, and the current number of entries.
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+            }
@@ -1,17 +1,30 @@
 # SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
 #
 # SPDX-License-Identifier: Apache-2.0
+import copy
 import logging
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from haystack import component, default_from_dict, default_to_dict
 from haystack.dataclasses import Document
 from haystack.document_stores.types import FilterPolicy
 from haystack.document_stores.types.filter_policy import apply_filter_policy
+from haystack_integrations.common.opensearch import QueryCache
 from haystack_integrations.document_stores.opensearch import OpenSearchDocumentStore
+from haystack_integrations.document_stores.opensearch.document_store import PlaceholderPaths, _index_placeholders
+from haystack_integrations.document_stores.opensearch.filters import simplify_filters
 
 logger = logging.getLogger(__name__)
 
+_FILTER_POLICIES: Dict[str, FilterPolicy] = {policy.value: policy for policy in FilterPolicy}
+
+
+def _filter_policy_from_str(filter_policy: str) -> FilterPolicy:
+    """
+    Same as `FilterPolicy.from_str`, with a plain dictionary lookup for the canonical values.
+    """
+    return _FILTER_POLICIES.get(filter_policy) or FilterPolicy.from_str(filter_policy)
+
 
 @component
 class OpenSearchBM25Retriever:
@@ -27,6 +40,7 @@ class OpenSearchBM25Retriever:
         filter_policy: Union[str, FilterPolicy] = FilterPolicy.REPLACE,
         custom_query: Optional[Dict[str, Any]] = None,
         raise_on_failure: bool = True,
+        cache_config: Optional[Dict[str, Any]] = None,
     ):
         """
         Create the OpenSearchBM25Retriever component.
@@ -66,6 +80,11 @@ class OpenSearchBM25Retriever:
         ```
         :param raise_on_failure:
             Whether to raise an exception if the API call fails. Otherwise log a warning and return an empty list.
+        :param cache_config:
+            If set, the results of `run()` are cached in memory, so that repeating a query with the same parameters
+            doesn't hit OpenSearch again. Supported keys are `max_size` (maximum number of cached queries, defaults
+            to 1000) and `ttl_seconds` (lifetime of a cached result, defaults to 300). Pass an empty dictionary to
+            use the defaults. Defaults to None, which disables caching.
 
         :raises ValueError: If `document_store` is not an instance of OpenSearchDocumentStore.
 
@@ -81,29 +100,49 @@ class OpenSearchBM25Retriever:
         self._scale_score = scale_score
         self._all_terms_must_match = all_terms_must_match
         self._filter_policy = (
-            filter_policy if isinstance(filter_policy, FilterPolicy) else FilterPolicy.from_str(filter_policy)
+            filter_policy if isinstance(filter_policy, FilterPolicy) else _filter_policy_from_str(filter_policy)
         )
         self._custom_query = custom_query
+        # Located once so that the placeholders of the init custom query aren't searched for on each call
+        self._custom_query_paths = (
+            _index_placeholders(custom_query, ("$query", "$filters")) if isinstance(custom_query, dict) else None
+        )
         self._raise_on_failure = raise_on_failure
+        self._cache_config = cache_config
+        self._cache = QueryCache(**cache_config) if cache_config is not None else None
+        self._to_dict_cache: Optional[Dict[str, Any]] = None
+        # Resolved once so that `run()` doesn't have to look up every default on each call
+        self._defaults = (
+            self._all_terms_must_match,
+            self._top_k,
+            self._fuzziness,
+            self._scale_score,
+            self._custom_query,
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         """
         Serializes the component to a dictionary.
 
+        The dictionary is built on the first call only, later calls return a copy of it.
+
         :returns:
             Dictionary with serialized data.
         """
-        return default_to_dict(
-            self,
-            filters=self._filters,
-            fuzziness=self._fuzziness,
-            top_k=self._top_k,
-            scale_score=self._scale_score,
-            document_store=self._document_store.to_dict(),
-            filter_policy=self._filter_policy.value,
-            custom_query=self._custom_query,
-            raise_on_failure=self._raise_on_failure,
-        )
+        if self._to_dict_cache is None:
+            self._to_dict_cache = default_to_dict(
+                self,
+                filters=self._filters,
+                fuzziness=self._fuzziness,
+                top_k=self._top_k,
+                scale_score=self._scale_score,
+                document_store=self._document_store.to_dict(),
+                filter_policy=self._filter_policy.value,
+                custom_query=self._custom_query,
+                raise_on_failure=self._raise_on_failure,
+                cache_config=self._cache_config,
+            )
+        return copy.deepcopy(self._to_dict_cache)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "OpenSearchBM25Retriever":
@@ -119,9 +158,66 @@ class OpenSearchBM25Retriever:
         data["init_parameters"]["document_store"] = OpenSearchDocumentStore.from_dict(
             data["init_parameters"]["document_store"]
         )
-        data["init_parameters"]["filter_policy"] = FilterPolicy.from_str(data["init_parameters"]["filter_policy"])
+        data["init_parameters"]["filter_policy"] = _filter_policy_from_str(data["init_parameters"]["filter_policy"])
         return default_from_dict(cls, data)
 
+    def get_cache_stats(self) -> Optional[Dict[str, int]]:
+        """
+        Returns the statistics of the query cache.
+
+        :returns:
+            A dictionary with the number of `hits`, `misses`, `evictions` and the current `size` of the cache,
+            or None if caching is disabled.
+        """
+        return self._cache.stats() if self._cache is not None else None
+
+    def _resolve_run_params(
+        self,
+        *,
+        filters: Optional[Dict[str, Any]],
+        all_terms_must_match: Optional[bool],
+        top_k: Optional[int],
+        fuzziness: Optional[str],
+        scale_score: Optional[bool],
+        custom_query: Optional[Dict[str, Any]],
+    ) -> Tuple[Dict[str, Any], bool, int, str, bool, Optional[Dict[str, Any]], Optional[PlaceholderPaths]]:
+        """
+        Applies the filter policy and replaces the parameters not given at runtime with the init ones.
+
+        :returns: The resolved parameters, in signature order, followed by the placeholder paths of the custom query
+            if it's the one the retriever was initialized with.
+        """
+        if filters is None and self._filter_policy is FilterPolicy.REPLACE:
+            # Nothing to merge or replace, the init filters apply as they are
+            filters = self._filters
+        else:
+            filters = apply_filter_policy(self._filter_policy, self._filters, filters)
+            if filters is None:
+                filters = self._filters
+            # Merging init and runtime filters can repeat conditions, there's no point sending them twice
+            filters = simplify_filters(filters)
+
+        (
+            default_all_terms_must_match,
+            default_top_k,
+            default_fuzziness,
+            default_scale_score,
+            default_custom_query,
+        ) = self._defaults
+        if all_terms_must_match is None:
+            all_terms_must_match = default_all_terms_must_match
+        if top_k is None:
+            top_k = default_top_k
+        if fuzziness is None:
+            fuzziness = default_fuzziness
+        if scale_score is None:
+            scale_score = default_scale_score
+        custom_query_paths = None
+        if custom_query is None:
+            custom_query = default_custom_query
+            custom_query_paths = self._custom_query_paths
+        return filters, all_terms_must_match, top_k, fuzziness, scale_score, custom_query, custom_query_paths
+
     @component.output_types(documents=List[Document])
     def run(
         self,
@@ -175,20 +271,25 @@ class OpenSearchBM25Retriever:
             - documents: List of retrieved Documents.
 
         """
-        filters = apply_filter_policy(self._filter_policy, self._filters, filters)
+        filters, all_terms_must_match, top_k, fuzziness, scale_score, custom_query, custom_query_paths = (
+            self._resolve_run_params(
+                filters=filters,
+                all_terms_must_match=all_terms_must_match,
+                top_k=top_k,
+                fuzziness=fuzziness,
+                scale_score=scale_score,
+                custom_query=custom_query,
+            )
+        )
 
-        if filters is None:
-            filters = self._filters
-        if all_terms_must_match is None:
-            all_terms_must_match = self._all_terms_must_match
-        if top_k is None:
-            top_k = self._top_k
-        if fuzziness is None:
-            fuzziness = self._fuzziness
-        if scale_score is None:
-            scale_score = self._scale_score
-        if custom_query is None:
-            custom_query = self._custom_query
+        cache_key = None
+        if self._cache is not None:
+            cache_key = QueryCache.make_key(
+                query, filters, top_k, fuzziness, scale_score, all_terms_must_match, custom_query
+            )
+            cached_docs = self._cache.get(cache_key)
+            if cached_docs is not None:
+                return {"documents": cached_docs}
 
         docs: List[Document] = []
 
@@ -201,7 +302,10 @@ class OpenSearchBM25Retriever:
                 scale_score=scale_score,
                 all_terms_must_match=all_terms_must_match,
                 custom_query=custom_query,
+                custom_query_paths=custom_query_paths,
             )
+            if self._cache is not None and cache_key is not None:
+                self._cache.put(cache_key, docs)
         except Exception as e:
             if self._raise_on_failure:
                 raise e
@@ -213,3 +317,95 @@ class OpenSearchBM25Retriever:
                 )
 
         return {"documents": docs}
+
+    def run_batch(
+        self,
+        queries: List[str],
+        filters: Optional[Dict[str, Any]] = None,
+        all_terms_must_match: Optional[bool] = None,
+        top_k: Optional[int] = None,
+        fuzziness: Optional[str] = None,
+        scale_score: Optional[bool] = None,
+        custom_query: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Retrieve documents for several queries at once using BM25 retrieval.
+
+        All queries are sent to OpenSearch in a single `msearch` request, which saves one round-trip per query
+        compared to calling `run()` repeatedly. When a cache is configured, the queries found in the cache are
+        answered from it and only the others are sent to OpenSearch.
+
+        :param queries: The query strings.
+        :param filters: Filters applied to the retrieved Documents of every query. The way runtime filters are applied
+                        depends on the `filter_policy` chosen at retriever initialization. See init method docstring for
+                        more details.
+        :param all_terms_must_match: If True, all terms in the query string must be present in the retrieved documents.
+        :param top_k: Maximum number of Documents to return per query.
+        :param fuzziness: Fuzziness parameter for full-text queries.
+        :param scale_score: Whether to scale the score of retrieved documents between 0 and 1.
+            This is useful when comparing documents across different indexes.
+        :param custom_query: The query containing a mandatory `$query` and an optional `$filters` placeholder.
+            See `run()` for an example.
+
+        :returns:
+            A dictionary containing the retrieved documents with the following structure:
+            - documents: One list of retrieved Documents for each query, in the same order as `queries`.
+        """
+        filters, all_terms_must_match, top_k, fuzziness, scale_score, custom_query, custom_query_paths = (
+            self._resolve_run_params(
+                filters=filters,
+                all_terms_must_match=all_terms_must_match,
+                top_k=top_k,
+                fuzziness=fuzziness,
+                scale_score=scale_score,
+                custom_query=custom_query,
+            )
+        )
+
+        docs: List[List[Document]] = [[] for _ in queries]
+        cache_keys: List[Optional[bytes]] = [None for _ in queries]
+        # Indexes of the queries that must be sent to OpenSearch, cache hits are served directly
+        pending = list(range(len(queries)))
+        if self._cache is not None:
+            pending = []
+            for index, query in enumerate(queries):
+                cache_key = QueryCache.make_key(
+                    query, filters, top_k, fuzziness, scale_score, all_terms_must_match, custom_query
+                )
+                cache_keys[index] = cache_key
+                cached_docs = self._cache.get(cache_key)
+                if cached_docs is not None:
+                    docs[index] = cached_docs
+                else:
+                    pending.append(index)
+
+        if not pending:
+            return {"documents": docs}
+
+        try:
+            results = self._document_store._bm25_retrieval_batch(
+                queries=[queries[index] for index in pending],
+                filters=filters,
+                fuzziness=fuzziness,
+                top_k=top_k,
+                scale_score=scale_score,
+                all_terms_must_match=all_terms_must_match,
+                custom_query=custom_query,
+                custom_query_paths=custom_query_paths,
+            )
+            for index, result in zip(pending, results):
+                docs[index] = result
+                pending_key = cache_keys[index]
+                if self._cache is not None and pending_key is not None:
+                    self._cache.put(pending_key, result)
+        except Exception as e:
+            if self._raise_on_failure:
+                raise e
+            else:
+                logger.warning(
+                    "An error during BM25 batch retrieval occurred and will be ignored by returning empty results: %s",
+                    str(e),
+                    exc_info=True,
+                )
+
+        return {"documents": docs}
@@ -1,8 +1,11 @@
 # SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
 #
 # SPDX-License-Identifier: Apache-2.0
+import json
 import logging
-from typing import Any, Dict, List, Mapping, Optional, Union
+import threading
+import weakref
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 
 import numpy as np
 from haystack import default_from_dict, default_to_dict
@@ -12,11 +15,21 @@ from haystack.document_stores.types import DuplicatePolicy
 from haystack.utils.filters import convert
 from haystack_integrations.document_stores.opensearch.filters import normalize_filters
 from opensearchpy import OpenSearch
+from opensearchpy.exceptions import SerializationError
 from opensearchpy.helpers import bulk
+from opensearchpy.serializer import JSONSerializer
+
+orjson_imported: bool = True
+try:
+    import orjson
+except ImportError:
+    orjson_imported = False
 
 logger = logging.getLogger(__name__)
 
 Hosts = Union[str, List[Union[str, Mapping[str, Union[str, int]]]]]
+# Keys and list indexes leading to a placeholder in a custom query, together with the placeholder
+PlaceholderPaths = Tuple[Tuple[Tuple[Union[str, int], ...], str], ...]
 
 # document scores are essentially unbounded and will be scaled to values between 0 and 1 if scale_score is set to
 # True. Scaling uses the expit function (inverse of the logit function) after applying a scaling factor
@@ -27,10 +40,53 @@ Hosts = Union[str, List[Union[str, Mapping[str, Union[str, int]]]]]
 # all be mapped to scores ~1.
 BM25_SCALING_FACTOR = 8
 
+# Stores connecting to the same cluster with the same settings share one client, and with it the pool of open
+# connections. The registry only holds weak references, a client lives as long as one of its stores does.
+_CLIENT_REGISTRY: "weakref.WeakValueDictionary[Tuple[Any, str], OpenSearch]" = weakref.WeakValueDictionary()
+_CLIENT_REGISTRY_LOCK = threading.Lock()
+
 DEFAULT_SETTINGS = {"index.knn": True}
 DEFAULT_MAX_CHUNK_BYTES = 100 * 1024 * 1024
 
 
+def _index_placeholders(custom_query: Dict[str, Any], placeholders: Tuple[str, ...]) -> PlaceholderPaths:
+    """
+    Finds where the placeholders are located in a custom query.
+
+    The result can be passed to the retrieval methods of `OpenSearchDocumentStore` together with `custom_query`,
+    so that the placeholders are replaced without searching the whole query again.
+
+    :param custom_query: The custom query to search.
+    :param placeholders: The placeholders to look for, e.g. `("$query", "$filters")`.
+    :returns: The path of keys and list indexes leading to each placeholder, together with the placeholder.
+    """
+    found = []
+    stack: List[Tuple[Tuple[Union[str, int], ...], Any]] = [((), custom_query)]
+    while stack:
+        path, value = stack.pop()
+        if isinstance(value, dict):
+            stack.extend(((*path, key), entry) for key, entry in value.items())
+        elif isinstance(value, list):
+            stack.extend(((*path, index), entry) for index, entry in enumerate(value))
+        elif isinstance(value, str) and value in placeholders:
+            found.append((path, value))
+    return tuple(found)
+
+
+class _OrjsonSerializer(JSONSerializer):
+    """
+    JSON serializer decoding the OpenSearch responses with orjson, which is several times faster than `json`.
+
+    Requests are still encoded by `JSONSerializer`, which knows how to encode NumPy, pandas and date values.
+    """
+
+    def loads(self, s: str) -> Any:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError as e:
+            raise SerializationError(s, e) from e
+
+
 class OpenSearchDocumentStore:
     def __init__(
         self,
@@ -54,6 +110,10 @@ class OpenSearchDocumentStore:
 
         For more information on connection parameters, see the [official OpenSearch documentation](https://opensearch.org/docs/latest/clients/python-low-level/#connecting-to-opensearch)
 
+        The OpenSearch responses are decoded with [orjson](https://github.com/ijl/orjson) if it's installed, which is
+        faster than the standard `json` module. Install it with `pip install "opensearch-haystack[orjson]"`.
+        Passing a `serializer` in `kwargs` disables this.
+
         :param hosts: List of hosts running the OpenSearch client. Defaults to None
         :param index: Name of index in OpenSearch, if it doesn't exist it will be created. Defaults to "default"
         :param max_chunk_bytes: Maximum size of the requests in bytes. Defaults to 100MB
@@ -70,7 +130,8 @@ class OpenSearchDocumentStore:
             for more information. Defaults to {"index.knn": True}
         :param create_index: Whether to create the index if it doesn't exist. Defaults to True
         :param **kwargs: Optional arguments that ``OpenSearch`` takes. For the full list of supported kwargs,
-            see the [official OpenSearch reference](https://opensearch-project.github.io/opensearch-py/api-ref/clients/opensearch_client.html)
+            see the [official OpenSearch reference](https://opensearch-project.github.io/opensearch-py/api-ref/clients/opensearch_client.html).
+            Stores created with the same `hosts` and `kwargs` share one client and its connection pool.
         """
         self._client = None
         self._hosts = hosts
@@ -106,22 +167,55 @@ class OpenSearchDocumentStore:
     @property
     def client(self) -> OpenSearch:
         if not self._client:
-            self._client = OpenSearch(self._hosts, **self._kwargs)
-            # Check client connection, this will raise if not connected
-            self._client.info()  # type:ignore
-
-        if self._client.indices.exists(index=self._index):  # type:ignore
-            logger.debug(
-                "The index '%s' already exists. The `embedding_dim`, `method`, `mappings`, and "
-                "`settings` values will be ignored.",
-                self._index,
-            )
-        elif self._create_index:
-            # Create the index if it doesn't exist
-            body = {"mappings": self._mappings, "settings": self._settings}
-            self._client.indices.create(index=self._index, body=body)  # type:ignore
+            client = self._get_shared_client()
+            if client.indices.exists(index=self._index):
+                logger.debug(
+                    "The index '%s' already exists. The `embedding_dim`, `method`, `mappings`, and "
+                    "`settings` values will be ignored.",
+                    self._index,
+                )
+            elif self._create_index:
+                # Create the index if it doesn't exist
+                body = {"mappings": self._mappings, "settings": self._settings}
+                client.indices.create(index=self._index, body=body)
+            self._client = client
         return self._client
 
+    def _get_shared_client(self) -> OpenSearch:
+        """
+        Returns the client of another store connected to the same cluster with the same settings, or a new one.
+        """
+        try:
+            signature = json.dumps([self._hosts, self._kwargs], sort_keys=True, default=repr)
+        except TypeError:
+            # Settings that can't be compared, don't share the client
+            signature = None
+
+        key = (OpenSearch, signature)
+        if signature is not None:
+            with _CLIENT_REGISTRY_LOCK:
+                shared_client = _CLIENT_REGISTRY.get(key)
+            if shared_client is not None:
+                return shared_client
+
+        kwargs = self._kwargs
+        if orjson_imported and "serializer" not in kwargs:
+            # Decoding the hits is a large part of the retrieval time, use orjson when it's installed
+            kwargs = {**kwargs, "serializer": _OrjsonSerializer()}
+        # The connection check is a network round-trip, it must not hold the lock other stores wait on
+        client = OpenSearch(self._hosts, **kwargs)
+        # Check client connection, this will raise if not connected
+        client.info()
+        if signature is None:
+            return client
+
+        with _CLIENT_REGISTRY_LOCK:
+            # Another store may have connected to the same cluster in the meantime, keep using its client
+            shared_client = _CLIENT_REGISTRY.setdefault(key, client)
+        if shared_client is not client:
+            client.close()
+        return shared_client
+
     def create_index(
         self,
         index: Optional[str] = None,
@@ -303,52 +397,23 @@ class OpenSearchDocumentStore:
             max_chunk_bytes=self._max_chunk_bytes,
         )
 
-    def _bm25_retrieval(
+    def _prepare_bm25_search_request(
         self,
         query: str,
         *,
         filters: Optional[Dict[str, Any]] = None,
         fuzziness: str = "AUTO",
         top_k: int = 10,
-        scale_score: bool = False,
         all_terms_must_match: bool = False,
         custom_query: Optional[Dict[str, Any]] = None,
-    ) -> List[Document]:
+        custom_query_paths: Optional[PlaceholderPaths] = None,
+    ) -> Dict[str, Any]:
         """
-        OpenSearch by defaults uses BM25 search algorithm.
-        Even though this method is called `bm25_retrieval` it searches for `query`
-        using the search algorithm `_client` was configured with.
-
-        This method is not meant to be part of the public interface of
-        `OpenSearchDocumentStore` nor called directly.
-        `OpenSearchBM25Retriever` uses this method directly and is the public interface for it.
+        Builds the body of the search request sent to OpenSearch for a BM25 query.
 
-        :param query: String to search in saved Documents' text.
-        :param filters: Optional filters to narrow down the search space.
-        :param fuzziness: Fuzziness parameter passed to OpenSearch, defaults to "AUTO". see the official documentation
-                          for valid [fuzziness values](https://www.elastic.co/guide/en/OpenSearch/reference/current/common-options.html#fuzziness)
-        :param top_k: Maximum number of Documents to return, defaults to 10
-        :param scale_score: If `True` scales the Document`s scores between 0 and 1, defaults to False
-        :param all_terms_must_match: If `True` all terms in `query` must be present in the Document, defaults to False
-        :param custom_query: The query containing a mandatory `$query` and an optional `$filters` placeholder
+        See `_bm25_retrieval` for a description of the parameters.
 
-            **An example custom_query:**
-
-            ```python
-            {
-                "query": {
-                    "bool": {
-                        "should": [{"multi_match": {
-                            "query": "$query",                 // mandatory query placeholder
-                            "type": "most_fields",
-                            "fields": ["content", "title"]}}],
-                        "filter": "$filters"                  // optional filter placeholder
-                    }
-                }
-            }
-            ```
-
-        :returns: List of Document that match `query`
+        :returns: The search request body.
         """
         if filters and "operator" not in filters and "conditions" not in filters:
             filters = convert(filters)
@@ -359,7 +424,11 @@ class OpenSearchDocumentStore:
                 body["query"]["bool"]["filter"] = normalize_filters(filters)
 
         if isinstance(custom_query, dict):
-            body = self._render_custom_query(custom_query, {"$query": query, "$filters": normalize_filters(filters)})
+            substitutions = {"$query": query, "$filters": normalize_filters(filters)}
+            if custom_query_paths is not None:
+                body = self._render_custom_query_at(custom_query, substitutions, custom_query_paths)
+            else:
+                body = self._render_custom_query(custom_query, substitutions)
 
         else:
             operator = "AND" if all_terms_must_match else "OR"
@@ -390,14 +459,137 @@ class OpenSearchDocumentStore:
         if not self._return_embedding:
             body["_source"] = {"excludes": ["embedding"]}
 
+        return body
+
+    @staticmethod
+    def _scale_bm25_scores(documents: List[Document]) -> None:
+        for doc in documents:
+            doc.score = float(1 / (1 + np.exp(-np.asarray(doc.score / BM25_SCALING_FACTOR))))  # type:ignore
+
+    def _bm25_retrieval(
+        self,
+        query: str,
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        fuzziness: str = "AUTO",
+        top_k: int = 10,
+        scale_score: bool = False,
+        all_terms_must_match: bool = False,
+        custom_query: Optional[Dict[str, Any]] = None,
+        custom_query_paths: Optional[PlaceholderPaths] = None,
+    ) -> List[Document]:
+        """
+        OpenSearch by defaults uses BM25 search algorithm.
+        Even though this method is called `bm25_retrieval` it searches for `query`
+        using the search algorithm `_client` was configured with.
+
+        This method is not meant to be part of the public interface of
+        `OpenSearchDocumentStore` nor called directly.
+        `OpenSearchBM25Retriever` uses this method directly and is the public interface for it.
+
+        :param query: String to search in saved Documents' text.
+        :param filters: Optional filters to narrow down the search space.
+        :param fuzziness: Fuzziness parameter passed to OpenSearch, defaults to "AUTO". see the official documentation
+                          for valid [fuzziness values](https://www.elastic.co/guide/en/OpenSearch/reference/current/common-options.html#fuzziness)
+        :param top_k: Maximum number of Documents to return, defaults to 10
+        :param scale_score: If `True` scales the Document`s scores between 0 and 1, defaults to False
+        :param all_terms_must_match: If `True` all terms in `query` must be present in the Document, defaults to False
+        :param custom_query: The query containing a mandatory `$query` and an optional `$filters` placeholder
+
+            **An example custom_query:**
+
+            ```python
+            {
+                "query": {
+                    "bool": {
+                        "should": [{"multi_match": {
+                            "query": "$query",                 // mandatory query placeholder
+                            "type": "most_fields",
+                            "fields": ["content", "title"]}}],
+                        "filter": "$filters"                  // optional filter placeholder
+                    }
+                }
+            }
+            ```
+
+        :param custom_query_paths: The locations of the placeholders in `custom_query`, as returned by
+            `_index_placeholders()`. When not given, the whole `custom_query` is searched for placeholders.
+        :returns: List of Document that match `query`
+        """
+        body = self._prepare_bm25_search_request(
+            query,
+            filters=filters,
+            fuzziness=fuzziness,
+            top_k=top_k,
+            all_terms_must_match=all_terms_must_match,
+            custom_query=custom_query,
+            custom_query_paths=custom_query_paths,
+        )
+
         documents = self._search_documents(**body)
 
         if scale_score:
-            for doc in documents:
-                doc.score = float(1 / (1 + np.exp(-np.asarray(doc.score / BM25_SCALING_FACTOR))))  # type:ignore
+            self._scale_bm25_scores(documents)
 
         return documents
 
+    def _bm25_retrieval_batch(
+        self,
+        queries: List[str],
+        *,
+        filters: Optional[Dict[str, Any]] = None,
+        fuzziness: str = "AUTO",
+        top_k: int = 10,
+        scale_score: bool = False,
+        all_terms_must_match: bool = False,
+        custom_query: Optional[Dict[str, Any]] = None,
+        custom_query_paths: Optional[PlaceholderPaths] = None,
+    ) -> List[List[Document]]:
+        """
+        Runs several BM25 queries in a single OpenSearch `msearch` request.
+
+        This method is not meant to be part of the public interface of
+        `OpenSearchDocumentStore` nor called directly.
+        `OpenSearchBM25Retriever.run_batch()` uses this method and is the public interface for it.
+
+        The parameters are applied to every query in `queries`, see `_bm25_retrieval` for their description.
+
+        :param queries: Strings to search in saved Documents' text.
+        :raises DocumentStoreError: If OpenSearch returns an error for any of the queries.
+        :returns: One list of Documents for each query, in the same order as `queries`.
+        """
+        if not queries:
+            return []
+
+        # The header and body of each search are encoded by the client's serializer, like in `_search_documents`
+        searches: List[Dict[str, Any]] = []
+        for query in queries:
+            body = self._prepare_bm25_search_request(
+                query,
+                filters=filters,
+                fuzziness=fuzziness,
+                top_k=top_k,
+                all_terms_must_match=all_terms_must_match,
+                custom_query=custom_query,
+                custom_query_paths=custom_query_paths,
+            )
+            searches.append({"index": self._index})
+            searches.append(body)
+
+        res = self.client.msearch(body=searches)
+
+        results: List[List[Document]] = []
+        for response in res["responses"]:
+            if "error" in response:
+                msg = f"Failed to run BM25 batch retrieval on OpenSearch. Error: {response['error']}"
+                raise DocumentStoreError(msg)
+            documents = [self._deserialize_document(hit) for hit in response["hits"]["hits"]]
+            if scale_score:
+                self._scale_bm25_scores(documents)
+            results.append(documents)
+
+        return results
+
     def _embedding_retrieval(
         self,
         query_embedding: List[float],
@@ -487,6 +679,34 @@ class OpenSearchDocumentStore:
         docs = self._search_documents(**body)
         return docs
 
+    def _render_custom_query_at(
+        self, custom_query: Dict[str, Any], substitutions: Dict[str, Any], custom_query_paths: PlaceholderPaths
+    ) -> Dict[str, Any]:
+        """
+        Replaces the placeholders found at `custom_query_paths` in the custom_query with the actual values.
+
+        Only the dictionaries and lists leading to a placeholder are copied, the rest of the returned query is
+        shared with `custom_query` and must not be modified.
+
+        :param custom_query: The custom query to replace the placeholders in.
+        :param substitutions: The dictionary containing the actual values to replace the placeholders with.
+        :param custom_query_paths: The locations of the placeholders, as returned by `_index_placeholders()`.
+        :returns: The custom query with the placeholders replaced.
+        """
+        rendered_query = dict(custom_query)
+        copied = {id(rendered_query)}
+        for path, placeholder in custom_query_paths:
+            target: Any = rendered_query
+            for key in path[:-1]:
+                child = target[key]
+                if id(child) not in copied:
+                    child = dict(child) if isinstance(child, dict) else list(child)
+                    copied.add(id(child))
+                    target[key] = child
+                target = child
+            target[path[-1]] = substitutions[placeholder]
+        return rendered_query
+
     def _render_custom_query(self, custom_query: Any, substitutions: Dict[str, Any]) -> Any:
         """
         Recursively replaces the placeholders in the custom_query with the actual values.
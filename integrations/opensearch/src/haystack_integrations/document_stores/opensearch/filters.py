@@ -2,7 +2,7 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from haystack.errors import FilterError
 from pandas import DataFrame
@@ -21,6 +21,85 @@ def normalize_filters(filters: Dict[str, Any]) -> Dict[str, Any]:
     return _parse_logical_condition(filters)
 
 
+def simplify_filters(filters: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Removes redundant clauses from Haystack filters, so that OpenSearch has fewer clauses to evaluate.
+
+    Duplicated conditions of a logical operator are dropped, nested `AND`s are merged into their parent `AND` and
+    `AND`s and `OR`s with a single condition are replaced by that condition.
+    This typically removes the duplicates introduced by merging init and runtime filters.
+    Filters that aren't logical conditions, including legacy filters, are returned untouched.
+
+    The range conditions on a same field are merged when the filters are converted, see `_normalize_ranges`,
+    so conditions are only moved to another level if that doesn't add a range on a field already compared there.
+    """
+    simplified_filters = _simplify_logical_condition(filters)
+    if simplified_filters is filters:
+        return filters
+    conditions = simplified_filters["conditions"]
+    if simplified_filters.get("operator") in ("AND", "OR") and len(conditions) == 1:
+        return conditions[0]
+    return simplified_filters
+
+
+def _simplify_logical_condition(filters: Dict[str, Any]) -> Dict[str, Any]:
+    if not isinstance(filters, dict) or "field" in filters or not isinstance(filters.get("conditions"), list):
+        return filters
+
+    operator = filters.get("operator")
+    # Conditions of the nested logical conditions that could replace them, indexed by position
+    replacements: Dict[int, List[Any]] = {}
+    simplified_conditions = []
+    for index, condition in enumerate(filters["conditions"]):
+        simplified_condition = _simplify_logical_condition(condition)
+        simplified_conditions.append(simplified_condition)
+        nested_operator = simplified_condition.get("operator") if isinstance(simplified_condition, dict) else None
+        nested_conditions = simplified_condition.get("conditions") if nested_operator else None
+        if isinstance(nested_conditions, list) and (
+            (operator == nested_operator == "AND") or (nested_operator in ("AND", "OR") and len(nested_conditions) == 1)
+        ):
+            replacements[index] = nested_conditions
+
+    # Range conditions of the level by field, a condition can only join them if it's the same as all of them
+    level_ranges: Dict[str, List[Dict[str, Any]]] = {}
+    for index, condition in enumerate(simplified_conditions):
+        field = _range_field(condition)
+        if index not in replacements and field:
+            level_ranges.setdefault(field, []).append(condition)
+
+    flattened_conditions: List[Any] = []
+    for index, simplified_condition in enumerate(simplified_conditions):
+        if index in replacements:
+            new_ranges = [(_range_field(c), c) for c in replacements[index] if _range_field(c)]
+            if all(r == c for field, c in new_ranges for r in level_ranges.get(field, [])):
+                flattened_conditions.extend(replacements[index])
+                for field, c in new_ranges:
+                    level_ranges.setdefault(field, []).append(c)
+                continue
+        flattened_conditions.append(simplified_condition)
+
+    # The last of the merged ranges wins, so the last of the duplicated conditions is the one kept
+    conditions: List[Any] = []
+    for condition in reversed(flattened_conditions):
+        if condition not in conditions:
+            conditions.append(condition)
+    conditions.reverse()
+
+    return {**filters, "conditions": conditions}
+
+
+def _range_field(condition: Any) -> Optional[str]:
+    """
+    Returns the field compared by `condition` if it's converted to a range query, None otherwise.
+    """
+    if not isinstance(condition, dict) or condition.get("operator") not in (">", ">=", "<", "<="):
+        return None
+    field = condition.get("field")
+    if isinstance(field, str) and field.startswith("meta."):
+        field = field[5:]
+    return field
+
+
 def _parse_logical_condition(condition: Dict[str, Any]) -> Dict[str, Any]:
     if "operator" not in condition:
         msg = f"'operator' key missing in {condition}"
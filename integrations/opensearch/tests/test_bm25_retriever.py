@@ -64,10 +64,37 @@ def test_to_dict(_mock_opensearch_client):
             "filter_policy": "replace",
             "custom_query": {"some": "custom query"},
             "raise_on_failure": True,
+            "cache_config": None,
         },
     }
 
 
+def test_to_dict_computed_once():
+    mock_store = Mock(spec=OpenSearchDocumentStore)
+    mock_store.to_dict.return_value = {"type": "OpenSearchDocumentStore", "init_parameters": {}}
+    retriever = OpenSearchBM25Retriever(document_store=mock_store, filters={"from": "init"})
+
+    first = retriever.to_dict()
+    first["init_parameters"]["filters"]["from"] = "modified"
+    second = retriever.to_dict()
+
+    mock_store.to_dict.assert_called_once()
+    assert second["init_parameters"]["filters"] == {"from": "init"}
+    assert second["init_parameters"]["document_store"] == {"type": "OpenSearchDocumentStore", "init_parameters": {}}
+
+
+def test_init_filter_policy_from_str():
+    mock_store = Mock(spec=OpenSearchDocumentStore)
+    assert (
+        OpenSearchBM25Retriever(document_store=mock_store, filter_policy="merge")._filter_policy == FilterPolicy.MERGE
+    )
+    assert (
+        OpenSearchBM25Retriever(document_store=mock_store, filter_policy="MERGE")._filter_policy == FilterPolicy.MERGE
+    )
+    with pytest.raises(ValueError):
+        OpenSearchBM25Retriever(document_store=mock_store, filter_policy="unknown")
+
+
 @patch("haystack_integrations.document_stores.opensearch.document_store.OpenSearch")
 def test_from_dict(_mock_opensearch_client):
     data = {
@@ -110,6 +137,7 @@ def test_run():
         scale_score=False,
         all_terms_must_match=False,
         custom_query=None,
+        custom_query_paths=None,
     )
     assert len(res) == 1
     assert len(res["documents"]) == 1
@@ -137,12 +165,30 @@ def test_run_init_params():
         scale_score=True,
         all_terms_must_match=True,
         custom_query={"some": "custom query"},
+        custom_query_paths=(),
     )
     assert len(res) == 1
     assert len(res["documents"]) == 1
     assert res["documents"][0].content == "Test doc"
 
 
+def test_run_custom_query_paths():
+    mock_store = Mock(spec=OpenSearchDocumentStore)
+    mock_store._bm25_retrieval.return_value = []
+    custom_query = {"query": {"bool": {"must": {"match": {"content": "$query"}}, "filter": "$filters"}}}
+    retriever = OpenSearchBM25Retriever(document_store=mock_store, custom_query=custom_query)
+
+    retriever.run(query="some query")
+    assert sorted(mock_store._bm25_retrieval.call_args[1]["custom_query_paths"]) == [
+        (("query", "bool", "filter"), "$filters"),
+        (("query", "bool", "must", "match", "content"), "$query"),
+    ]
+
+    # Placeholders of runtime custom queries are searched for by the document store
+    retriever.run(query="some query", custom_query={"query": {"match": {"content": "$query"}}})
+    assert mock_store._bm25_retrieval.call_args[1]["custom_query_paths"] is None
+
+
 def test_run_time_params():
     mock_store = Mock(spec=OpenSearchDocumentStore)
     mock_store._bm25_retrieval.return_value = [Document(content="Test doc")]
@@ -170,12 +216,84 @@ def test_run_time_params():
         scale_score=False,
         all_terms_must_match=False,
         custom_query=None,
+        custom_query_paths=None,
     )
     assert len(res) == 1
     assert len(res["documents"]) == 1
     assert res["documents"][0].content == "Test doc"
 
 
+@patch("haystack_integrations.components.retrievers.opensearch.bm25_retriever.apply_filter_policy")
+def test_run_skips_filter_policy_without_runtime_filters(mock_apply_filter_policy):
+    mock_store = Mock(spec=OpenSearchDocumentStore)
+    mock_store._bm25_retrieval.return_value = []
+    retriever = OpenSearchBM25Retriever(document_store=mock_store, filters={"from": "init"})
+
+    retriever.run(query="some query")
+
+    mock_apply_filter_policy.assert_not_called()
+    assert mock_store._bm25_retrieval.call_args.kwargs["filters"] == {"from": "init"}
+
+
+def test_run_merge_filter_policy():
+    mock_store = Mock(spec=OpenSearchDocumentStore)
+    mock_store._bm25_retrieval.return_value = []
+    init_filters = {"field": "meta.type", "operator": "==", "value": "article"}
+    runtime_filters = {"field": "meta.rating", "operator": ">=", "value": 3}
+    retriever = OpenSearchBM25Retriever(
+        document_store=mock_store, filters=init_filters, filter_policy=FilterPolicy.MERGE
+    )
+
+    retriever.run(query="some query", filters=runtime_filters)
+
+    assert mock_store._bm25_retrieval.call_args.kwargs["filters"] == {
+        "operator": "AND",
+        "conditions": [init_filters, runtime_filters],
+    }
+
+
+def test_run_merge_filter_policy_duplicated_conditions():
+    mock_store = Mock(spec=OpenSearchDocumentStore)
+    mock_store._bm25_retrieval.return_value = []
+    filters = {"field": "meta.type", "operator": "==", "value": "article"}
+    retriever = OpenSearchBM25Retriever(document_store=mock_store, filters=filters, filter_policy=FilterPolicy.MERGE)
+
+    retriever.run(query="some query", filters=filters)
+
+    assert mock_store._bm25_retrieval.call_args.kwargs["filters"] == filters
+
+
+def test_run_with_cache():
+    mock_store = Mock(spec=OpenSearchDocumentStore)
+    mock_store._bm25_retrieval.return_value = [Document(content="Test doc")]
+    retriever = OpenSearchBM25Retriever(document_store=mock_store, cache_config={"max_size": 10, "ttl_seconds": 60})
+
+    first = retriever.run(query="some query")["documents"]
+    second = retriever.run(query="some query")["documents"]
+    retriever.run(query="some query", top_k=3)
+    retriever.run(query="another query")
+
+    assert mock_store._bm25_retrieval.call_count == 3
+    assert first == second
+    assert second[0] is not first[0]
+    assert retriever.get_cache_stats() == {"hits": 1, "misses": 3, "evictions": 0, "size": 3}
+
+
+def test_run_with_cache_does_not_store_failures():
+    mock_store = Mock(spec=OpenSearchDocumentStore)
+    mock_store._bm25_retrieval.side_effect = [Exception("Some error"), [Document(content="Test doc")]]
+    retriever = OpenSearchBM25Retriever(document_store=mock_store, raise_on_failure=False, cache_config={})
+
+    assert retriever.run(query="some query")["documents"] == []
+    assert retriever.run(query="some query")["documents"][0].content == "Test doc"
+    assert retriever.get_cache_stats()["size"] == 1
+
+
+def test_get_cache_stats_without_cache():
+    retriever = OpenSearchBM25Retriever(document_store=Mock(spec=OpenSearchDocumentStore))
+    assert retriever.get_cache_stats() is None
+
+
 def test_run_ignore_errors(caplog):
     mock_store = Mock(spec=OpenSearchDocumentStore)
     mock_store._bm25_retrieval.side_effect = Exception("Some error")
@@ -184,3 +302,53 @@ def test_run_ignore_errors(caplog):
     assert len(res) == 1
     assert res["documents"] == []
     assert "Some error" in caplog.text
+
+
+def test_run_batch():
+    mock_store = Mock(spec=OpenSearchDocumentStore)
+    mock_store._bm25_retrieval_batch.return_value = [[Document(content="Test doc")], []]
+    retriever = OpenSearchBM25Retriever(document_store=mock_store, filters={"from": "init"}, top_k=11)
+    res = retriever.run_batch(queries=["some query", "another query"], fuzziness="2")
+    mock_store._bm25_retrieval_batch.assert_called_once_with(
+        queries=["some query", "another query"],
+        filters={"from": "init"},
+        fuzziness="2",
+        top_k=11,
+        scale_score=False,
+        all_terms_must_match=False,
+        custom_query=None,
+        custom_query_paths=None,
+    )
+    assert len(res) == 1
+    assert len(res["documents"]) == 2
+    assert res["documents"][0][0].content == "Test doc"
+    assert res["documents"][1] == []
+
+
+def test_run_batch_with_cache():
+    mock_store = Mock(spec=OpenSearchDocumentStore)
+    mock_store._bm25_retrieval.return_value = [Document(content="Cached doc")]
+    mock_store._bm25_retrieval_batch.return_value = [[Document(content="Test doc")]]
+    retriever = OpenSearchBM25Retriever(document_store=mock_store, cache_config={"max_size": 10, "ttl_seconds": 60})
+    retriever.run(query="some query")
+
+    res = retriever.run_batch(queries=["some query", "another query"])
+
+    assert mock_store._bm25_retrieval_batch.call_args.kwargs["queries"] == ["another query"]
+    assert res["documents"][0][0].content == "Cached doc"
+    assert res["documents"][1][0].content == "Test doc"
+
+    # Every query is in the cache now
+    res = retriever.run_batch(queries=["another query", "some query"])
+    assert mock_store._bm25_retrieval_batch.call_count == 1
+    assert [docs[0].content for docs in res["documents"]] == ["Test doc", "Cached doc"]
+    assert retriever.get_cache_stats() == {"hits": 3, "misses": 2, "evictions": 0, "size": 2}
+
+
+def test_run_batch_ignore_errors(caplog):
+    mock_store = Mock(spec=OpenSearchDocumentStore)
+    mock_store._bm25_retrieval_batch.side_effect = Exception("Some error")
+    retriever = OpenSearchBM25Retriever(document_store=mock_store, raise_on_failure=False)
+    res = retriever.run_batch(queries=["some query", "another query"])
+    assert res["documents"] == [[], []]
+    assert "Some error" in caplog.text
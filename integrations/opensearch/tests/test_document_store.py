@@ -1,9 +1,11 @@
 # SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
 #
 # SPDX-License-Identifier: Apache-2.0
+import json
 import random
+from datetime import datetime, timezone
 from typing import List
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 from haystack.dataclasses.document import Document
@@ -11,8 +13,14 @@ from haystack.document_stores.errors import DocumentStoreError, DuplicateDocumen
 from haystack.document_stores.types import DuplicatePolicy
 from haystack.testing.document_store import DocumentStoreBaseTests
 from haystack_integrations.document_stores.opensearch import OpenSearchDocumentStore
-from haystack_integrations.document_stores.opensearch.document_store import DEFAULT_MAX_CHUNK_BYTES
-from opensearchpy.exceptions import RequestError
+from haystack_integrations.document_stores.opensearch.document_store import (
+    _CLIENT_REGISTRY_LOCK,
+    DEFAULT_MAX_CHUNK_BYTES,
+    _index_placeholders,
+    _OrjsonSerializer,
+)
+from opensearchpy.exceptions import RequestError, SerializationError
+from opensearchpy.serializer import JSONSerializer
 
 
 @patch("haystack_integrations.document_stores.opensearch.document_store.OpenSearch")
@@ -85,6 +93,84 @@ def test_init_is_lazy(_mock_opensearch_client):
     _mock_opensearch_client.assert_not_called()
 
 
+@patch("haystack_integrations.document_stores.opensearch.document_store.OpenSearch")
+def test_client_decodes_responses_with_orjson(_mock_opensearch_client):
+    pytest.importorskip("orjson")
+    OpenSearchDocumentStore(hosts="testhost").client  # noqa: B018
+    assert isinstance(_mock_opensearch_client.call_args.kwargs["serializer"], _OrjsonSerializer)
+
+    serializer = JSONSerializer()
+    OpenSearchDocumentStore(hosts="testhost", serializer=serializer).client  # noqa: B018
+    assert _mock_opensearch_client.call_args.kwargs["serializer"] is serializer
+
+
+@patch("haystack_integrations.document_stores.opensearch.document_store.orjson_imported", False)
+@patch("haystack_integrations.document_stores.opensearch.document_store.OpenSearch")
+def test_client_without_orjson(_mock_opensearch_client):
+    OpenSearchDocumentStore(hosts="testhost").client  # noqa: B018
+    assert "serializer" not in _mock_opensearch_client.call_args.kwargs
+
+
+@patch("haystack_integrations.document_stores.opensearch.document_store.OpenSearch")
+def test_client_is_shared_between_stores(_mock_opensearch_client):
+    _mock_opensearch_client.side_effect = lambda *_args, **_kwargs: Mock()
+    store = OpenSearchDocumentStore(hosts="testhost", index="first")
+    same_cluster = OpenSearchDocumentStore(hosts="testhost", index="second")
+    other_cluster = OpenSearchDocumentStore(hosts="otherhost", index="first")
+
+    assert store.client is same_cluster.client
+    assert store.client is not other_cluster.client
+    assert _mock_opensearch_client.call_count == 2
+    # Each store still sets up its own index
+    store.client.indices.exists.assert_any_call(index="first")
+    store.client.indices.exists.assert_any_call(index="second")
+
+
+@patch("haystack_integrations.document_stores.opensearch.document_store.OpenSearch")
+def test_client_connection_check_does_not_hold_registry_lock(_mock_opensearch_client):
+    def info():
+        # Another store connecting while this one waits for the cluster isn't blocked
+        assert _CLIENT_REGISTRY_LOCK.acquire(blocking=False)
+        _CLIENT_REGISTRY_LOCK.release()
+
+    _mock_opensearch_client.return_value.info.side_effect = info
+    OpenSearchDocumentStore(hosts="testhost").client  # noqa: B018
+    _mock_opensearch_client.return_value.info.assert_called_once()
+
+
+@patch("haystack_integrations.document_stores.opensearch.document_store.OpenSearch")
+def test_client_registered_while_connecting_is_reused(_mock_opensearch_client):
+    first_client, second_client = Mock(), Mock()
+    _mock_opensearch_client.side_effect = [first_client, second_client]
+    other_store = OpenSearchDocumentStore(hosts="testhost", index="other")
+    # The other store connects to the same cluster while the first client is checking the connection
+    first_client.info.side_effect = lambda: other_store.client
+
+    store = OpenSearchDocumentStore(hosts="testhost")
+
+    assert store.client is second_client
+    assert other_store.client is second_client
+    first_client.close.assert_called_once()
+
+
+@patch("haystack_integrations.document_stores.opensearch.document_store.OpenSearch")
+def test_client_checks_index_once(_mock_opensearch_client):
+    store = OpenSearchDocumentStore(hosts="testhost")
+    store.client  # noqa: B018
+    store.client  # noqa: B018
+    _mock_opensearch_client.return_value.info.assert_called_once()
+    _mock_opensearch_client.return_value.indices.exists.assert_called_once()
+
+
+def test_orjson_serializer():
+    pytest.importorskip("orjson")
+    serializer = _OrjsonSerializer()
+    assert serializer.loads('{"hits": {"hits": [{"_score": 1.5}]}}') == {"hits": {"hits": [{"_score": 1.5}]}}
+    assert serializer.dumps({"query": "some query"}) == '{"query":"some query"}'
+    with pytest.raises(SerializationError):
+        serializer.loads("{not json")
+
+
 @patch("haystack_integrations.document_stores.opensearch.document_store.OpenSearch")
 def test_get_default_mappings(_mock_opensearch_client):
     store = OpenSearchDocumentStore(hosts="testhost", embedding_dim=1536, method={"name": "hnsw"})
@@ -96,6 +182,100 @@ def test_get_default_mappings(_mock_opensearch_client):
     }
 
 
+@patch("haystack_integrations.document_stores.opensearch.document_store.OpenSearch")
+def test_bm25_retrieval_batch_sends_single_msearch(_mock_opensearch_client):
+    store = OpenSearchDocumentStore(hosts="testhost", index="my_index")
+    client = _mock_opensearch_client.return_value
+    client.msearch.return_value = {
+        "responses": [
+            {"hits": {"hits": [{"_source": {"id": "1", "content": "first"}, "_score": 2.0}]}},
+            {"hits": {"hits": []}},
+        ]
+    }
+
+    res = store._bm25_retrieval_batch(["first query", "second query"], top_k=3)
+
+    client.msearch.assert_called_once()
+    searches = client.msearch.call_args.kwargs["body"]
+    assert len(searches) == 4
+    assert searches[0] == {"index": "my_index"}
+    assert searches[1]["query"]["bool"]["must"][0]["multi_match"]["query"] == "first query"
+    assert searches[1]["size"] == 3
+    assert searches[2] == {"index": "my_index"}
+    assert searches[3]["query"]["bool"]["must"][0]["multi_match"]["query"] == "second query"
+    assert len(res) == 2
+    assert res[0][0].content == "first"
+    assert res[0][0].score == 2.0
+    assert res[1] == []
+
+
+@patch("haystack_integrations.document_stores.opensearch.document_store.OpenSearch")
+def test_bm25_retrieval_batch_encodes_with_client_serializer(_mock_opensearch_client):
+    store = OpenSearchDocumentStore(hosts="testhost", index="my_index")
+    client = _mock_opensearch_client.return_value
+    client.msearch.return_value = {"responses": [{"hits": {"hits": []}}]}
+    filters = {"field": "meta.date", "operator": ">", "value": datetime(2024, 1, 1, tzinfo=timezone.utc)}
+
+    store._bm25_retrieval_batch(["query"], filters=filters)
+
+    searches = client.msearch.call_args.kwargs["body"]
+    # The searches are passed as dicts, opensearch-py encodes them with the transport serializer
+    assert isinstance(searches[1], dict)
+    assert "2024-01-01T00:00:00" in JSONSerializer().dumps(searches[1])
+
+
+@patch("haystack_integrations.document_stores.opensearch.document_store.OpenSearch")
+def test_bm25_retrieval_batch_raises_on_error_response(_mock_opensearch_client):
+    store = OpenSearchDocumentStore(hosts="testhost")
+    _mock_opensearch_client.return_value.msearch.return_value = {"responses": [{"error": "some error"}]}
+
+    with pytest.raises(DocumentStoreError, match="some error"):
+        store._bm25_retrieval_batch(["query"])
+
+
+def test_index_placeholders():
+    custom_query = {
+        "query": {
+            "bool": {
+                "should": [{"match": {"content": "$query"}}, {"match": {"title": {"query": "$query", "boost": 2}}}],
+                "filter": "$filters",
+            }
+        },
+        "size": 3,
+    }
+    paths = _index_placeholders(custom_query, ("$query", "$filters"))
+    assert sorted(paths) == sorted(
+        [
+            (("query", "bool", "should", 0, "match", "content"), "$query"),
+            (("query", "bool", "should", 1, "match", "title", "query"), "$query"),
+            (("query", "bool", "filter"), "$filters"),
+        ]
+    )
+
+
+@patch("haystack_integrations.document_stores.opensearch.document_store.OpenSearch")
+def test_render_custom_query_at(_mock_opensearch_client):
+    document_store = OpenSearchDocumentStore(hosts="some hosts")
+    custom_query = {
+        "query": {
+            "bool": {
+                "should": [{"match": {"content": "$query"}}, {"match": {"title": {"query": "$query", "boost": 2}}}],
+                "filter": "$filters",
+            }
+        },
+        "highlight": {"fields": {"content": {}}},
+    }
+    original = json.loads(json.dumps(custom_query))
+    substitutions = {"$query": "some query", "$filters": {"term": {"meta.type": "article"}}}
+
+    rendered = document_store._render_custom_query_at(
+        custom_query, substitutions, _index_placeholders(custom_query, ("$query", "$filters"))
+    )
+
+    assert rendered == document_store._render_custom_query(custom_query, substitutions)
+    assert custom_query == original
+
+
 @pytest.mark.integration
 class TestDocumentStore(DocumentStoreBaseTests):
     """
@@ -232,6 +412,23 @@ class TestDocumentStore(DocumentStoreBaseTests):
         assert "functional" in res[1].content
         assert "functional" in res[2].content
 
+    def test_bm25_retrieval_batch(self, document_store: OpenSearchDocumentStore):
+        document_store.write_documents(
+            [
+                Document(content="Haskell is a functional programming language"),
+                Document(content="Lisp is a functional programming language"),
+                Document(content="C++ is an object oriented programming language"),
+                Document(content="Dart is an object oriented programming language"),
+            ]
+        )
+
+        res = document_store._bm25_retrieval_batch(["functional", "object oriented"], top_k=2)
+        assert len(res) == 2
+        assert len(res[0]) == 2
+        assert all("functional" in doc.content for doc in res[0])
+        assert len(res[1]) == 2
+        assert all("object oriented" in doc.content for doc in res[1])
+
     def test_bm25_retrieval_pagination(self, document_store: OpenSearchDocumentStore):
         """
         Test that handling of pagination works as expected, when the matching documents are > 10.
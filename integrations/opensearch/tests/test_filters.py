@@ -3,7 +3,11 @@
 # SPDX-License-Identifier: Apache-2.0
 import pytest
 from haystack.errors import FilterError
-from haystack_integrations.document_stores.opensearch.filters import _normalize_ranges, normalize_filters
+from haystack_integrations.document_stores.opensearch.filters import (
+    _normalize_ranges,
+    normalize_filters,
+    simplify_filters,
+)
 
 filters_data = [
     (
@@ -218,3 +222,66 @@ def test_normalize_ranges():
     assert conditions == [
         {"range": {"date": {"lt": "2021-01-01", "gte": "2015-01-01"}}},
     ]
+
+
+def test_simplify_filters():
+    article = {"field": "meta.type", "operator": "==", "value": "article"}
+    rating = {"field": "meta.rating", "operator": ">=", "value": 3}
+    genre = {"field": "meta.genre", "operator": "in", "value": ["economy", "politics"]}
+
+    # Duplicates are dropped and nested logical conditions with the same operator are merged
+    filters = {
+        "operator": "AND",
+        "conditions": [article, {"operator": "AND", "conditions": [article, rating]}, rating],
+    }
+    assert simplify_filters(filters) == {"operator": "AND", "conditions": [article, rating]}
+
+    # Logical conditions with a single condition are replaced by it
+    assert simplify_filters({"operator": "AND", "conditions": [article, article]}) == article
+    assert simplify_filters({"operator": "OR", "conditions": [{"operator": "AND", "conditions": [genre]}]}) == genre
+
+    # NOT conditions are deduplicated but kept
+    assert simplify_filters({"operator": "NOT", "conditions": [article, article]}) == {
+        "operator": "NOT",
+        "conditions": [article],
+    }
+
+    # Different operators aren't merged
+    filters = {"operator": "OR", "conditions": [article, {"operator": "AND", "conditions": [rating, genre]}]}
+    assert simplify_filters(filters) == filters
+
+
+def test_simplify_filters_keeps_or_conditions_apart():
+    lower = {"field": "meta.x", "operator": "<", "value": 1}
+    greater = {"field": "meta.x", "operator": ">", "value": 5}
+    name = {"field": "meta.y", "operator": "==", "value": "a"}
+
+    # Ranges on the same field of a logical level are merged when converted, which is only correct for AND,
+    # so nested ORs and single condition ANDs must not be moved up into an OR
+    nested_or = {"operator": "OR", "conditions": [lower, {"operator": "OR", "conditions": [greater, name]}]}
+    single_and = {"operator": "OR", "conditions": [lower, {"operator": "AND", "conditions": [greater]}]}
+    for filters in (nested_or, single_and):
+        assert simplify_filters(filters) == filters
+        assert normalize_filters(simplify_filters(filters)) == normalize_filters(filters)
+
+
+def test_simplify_filters_keeps_merged_ranges():
+    lower = {"field": "meta.x", "operator": "<", "value": 3}
+    lowest = {"field": "meta.x", "operator": "<", "value": 2}
+
+    # The last of the ranges on a same field wins when they're merged, so it must stay the last one
+    filters = {"operator": "AND", "conditions": [lower, lowest, lower]}
+    assert simplify_filters(filters) == {"operator": "AND", "conditions": [lowest, lower]}
+    assert normalize_filters(simplify_filters(filters)) == normalize_filters(filters)
+
+    # A nested AND comparing a field differently isn't merged into its parent
+    filters = {"operator": "AND", "conditions": [lower, {"operator": "AND", "conditions": [lowest]}]}
+    assert simplify_filters(filters) == filters
+
+
+def test_simplify_filters_untouched():
+    comparison = {"field": "meta.type", "operator": "==", "value": "article"}
+    assert simplify_filters(comparison) is comparison
+    legacy_filters = {"type": "article", "rating": {"$gte": 3}}
+    assert simplify_filters(legacy_filters) is legacy_filters
+    assert simplify_filters({}) == {}
@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: 2023-present deepset GmbH <info@deepset.ai>
+#
+# SPDX-License-Identifier: Apache-2.0
+from unittest.mock import patch
+
+import pytest
+from haystack.dataclasses import Document
+from haystack_integrations.common.opensearch import QueryCache
+
+
+def test_init_invalid():
+    with pytest.raises(ValueError):
+        QueryCache(max_size=0)
+    with pytest.raises(ValueError):
+        QueryCache(ttl_seconds=0)
+
+
+def test_make_key():
+    key = QueryCache.make_key([0.1, 0.2], {"b": 1, "a": 2}, 10, True)
+    assert key == QueryCache.make_key([0.1, 0.2], {"a": 2, "b": 1}, 10, True)
+    assert key != QueryCache.make_key([0.1, 0.2], {"a": 2, "b": 1}, 10, False)
+    assert key != QueryCache.make_key([0.1, 0.3], {"a": 2, "b": 1}, 10, True)
+
+
+def test_make_key_query_kinds():
+    keys = {
+        QueryCache.make_key(query, None, 10)
+        for query in (
+            "some query",
+            "[0.1, 0.2]",
+            [0.1, 0.2],
+            [1, 2],
+            [[0.1, 0.2]],
+            ([1, 2], [0.1, 0.2]),
+            ([1], [2, 0.1, 0.2]),
+            ([0.5, 0.5], [1, 2], [0.1, 0.2]),
+        )
+    }
+    assert len(keys) == 8
+    assert QueryCache.make_key(([1, 2], [0.1, 0.2]), None, 10) == QueryCache.make_key(([1, 2], [0.1, 0.2]), None, 10)
+
+
+def test_get_put():
+    cache = QueryCache()
+    docs = [Document(content="doc")]
+    cache.put(b"key", docs)
+    docs[0].content = "modified"
+
+    cached = cache.get(b"key")
+    assert cached == [Document(id=cached[0].id, content="doc")]
+    cached[0].meta["changed"] = True
+    assert cache.get(b"key")[0].meta == {}
+    assert cache.get(b"missing") is None
+    assert cache.stats() == {"hits": 2, "misses": 1, "evictions": 0, "size": 1}
+
+
+def test_get_put_not_picklable():
+    cache = QueryCache()
+    value = {"callback": lambda: None, "items": [1]}
+    cache.put(b"key", value)
+    value["items"].append(2)
+
+    cached = cache.get(b"key")
+    assert cached["items"] == [1]
+    assert cached["callback"] is value["callback"]
+    cached["items"].append(3)
+    assert cache.get(b"key")["items"] == [1]
+
+
+def test_lru_eviction():
+    cache = QueryCache(max_size=2)
+    cache.put(b"a", 1)
+    cache.put(b"b", 2)
+    cache.get(b"a")
+    cache.put(b"c", 3)
+
+    assert cache.get(b"b") is None
+    assert cache.get(b"a") == 1
+    assert cache.get(b"c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_ttl_expiration():
+    cache = QueryCache(ttl_seconds=10)
+    with patch("haystack_integrations.common.opensearch.query_cache.time.monotonic", return_value=100.0):
+        cache.put(b"a", 1)
+    with patch("haystack_integrations.common.opensearch.query_cache.time.monotonic", return_value=105.0):
+        assert cache.get(b"a") == 1
+    with patch("haystack_integrations.common.opensearch.query_cache.time.monotonic", return_value=111.0):
+        assert cache.get(b"a") is None
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 1, "size": 0}
+
+
+def test_clear():
+    cache = QueryCache()
+    cache.put(b"a", 1)
+    cache.clear()
+    assert cache.get(b"a") is None
+    assert cache.stats()["size"] == 0
@@ -1,12 +1,146 @@
-from typing import Any, Dict, List, Optional, Union
+import asyncio
+import copy
+import functools
+import json
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import numpy as np
 from haystack import Document, component, default_from_dict, default_to_dict
 from haystack.dataclasses.sparse_embedding import SparseEmbedding
 from haystack.document_stores.types import FilterPolicy
 from haystack.document_stores.types.filter_policy import apply_filter_policy
+from haystack_integrations.common.qdrant import QueryCache
 from haystack_integrations.document_stores.qdrant import QdrantDocumentStore
+from haystack_integrations.document_stores.qdrant.filters import convert_filters_to_qdrant, simplify_qdrant_filter
 from qdrant_client.http import models
 
+FILTER_CACHE_SIZE = 128
+
+_FILTER_POLICIES: Dict[str, FilterPolicy] = {policy.value: policy for policy in FilterPolicy}
+
+
+def _filter_policy_from_str(filter_policy: str) -> FilterPolicy:
+    """
+    Same as `FilterPolicy.from_str`, with a plain dictionary lookup for the canonical values.
+    """
+    return _FILTER_POLICIES.get(filter_policy) or FilterPolicy.from_str(filter_policy)
+
+
+def _to_float_list(values: Union[List[float], np.ndarray]) -> List[float]:
+    """
+    Returns `values` as the plain list of floats expected by the Qdrant client.
+
+    Lists are returned untouched. NumPy arrays are converted once using float32 precision, which is the precision
+    Qdrant stores vectors with, so that no conversion is repeated further down the call chain.
+    """
+    if isinstance(values, np.ndarray):
+        return values.astype(np.float32, copy=False).tolist()
+    return values
+
+
+def _normalize_sparse_embedding(sparse_embedding: SparseEmbedding) -> SparseEmbedding:
+    """
+    Returns `sparse_embedding` with indices and values as plain lists, see `_to_float_list`.
+    """
+    if isinstance(sparse_embedding.values, np.ndarray) or isinstance(sparse_embedding.indices, np.ndarray):
+        return SparseEmbedding(
+            indices=np.asarray(sparse_embedding.indices, dtype=np.int64).tolist(),
+            values=_to_float_list(np.asarray(sparse_embedding.values)),
+        )
+    return sparse_embedding
+
+
+@functools.lru_cache(maxsize=FILTER_CACHE_SIZE)
+def _compile_filters(serialized_filters: str) -> Optional[models.Filter]:
+    """
+    Converts JSON serialized Haystack filters to a simplified Qdrant `Filter`, caching the result.
+
+    The returned `Filter` is shared by all the callers using the same filters and must not be modified.
+    """
+    return simplify_qdrant_filter(convert_filters_to_qdrant(json.loads(serialized_filters)))
+
+
+def _to_qdrant_filters(
+    filters: Optional[Union[Dict[str, Any], models.Filter]],
+) -> Optional[Union[Dict[str, Any], models.Filter]]:
+    """
+    Returns `filters` converted to a Qdrant `Filter`, so that filters repeated across queries are only parsed once.
+
+    Qdrant `Filter`s and empty filters are returned untouched. Filters that can't be serialized to JSON losslessly
+    are converted on every call.
+    """
+    if not filters or not isinstance(filters, dict):
+        return filters
+    try:
+        serialized_filters = json.dumps(filters, sort_keys=True)
+    except (TypeError, ValueError):
+        return simplify_qdrant_filter(convert_filters_to_qdrant(filters))
+    return _compile_filters(serialized_filters)
+
+
+def _resolve_run_params(
+    retriever: Union["QdrantEmbeddingRetriever", "QdrantSparseEmbeddingRetriever", "QdrantHybridRetriever"],
+    filters: Optional[Union[Dict[str, Any], models.Filter]],
+    params: Tuple[Any, ...],
+) -> Tuple[Optional[Union[Dict[str, Any], models.Filter]], Tuple[Any, ...]]:
+    """
+    Applies the filter policy of `retriever` and replaces the `params` not given at runtime with its init values.
+
+    :param params: The runtime parameters, in the same order as the `_defaults` of `retriever`.
+    :returns: The filters to use and the resolved parameters, in the order of `params`.
+    """
+    if filters is None and retriever._filter_policy is FilterPolicy.REPLACE:
+        # Nothing to merge or replace, the init filters apply as they are
+        filters = retriever._filters
+    else:
+        filters = apply_filter_policy(retriever._filter_policy, retriever._filters, filters)
+    return filters, tuple(default if param is None else param for param, default in zip(params, retriever._defaults))
+
+
+def _maximal_marginal_relevance(
+    query_embedding: List[float], embeddings: List[List[float]], top_k: int, lambda_mult: float
+) -> List[int]:
+    """
+    Selects `top_k` embeddings using Maximal Marginal Relevance.
+
+    At each step, the embedding maximizing `lambda_mult * relevance - (1 - lambda_mult) * redundancy` is selected,
+    where relevance is the cosine similarity to the query and redundancy is the highest cosine similarity to the
+    embeddings selected so far.
+
+    :returns: The indices of the selected embeddings, in order of selection.
+    """
+    if top_k <= 0 or not embeddings:
+        return []
+
+    vectors = np.asarray(embeddings, dtype=np.float32)
+    query = np.asarray(query_embedding, dtype=np.float32)
+
+    norms = np.linalg.norm(vectors, axis=1)
+    norms[norms == 0] = 1.0
+    vectors = vectors / norms[:, None]
+    query_norm = np.linalg.norm(query)
+    if query_norm:
+        query = query / query_norm
+
+    relevance = vectors @ query
+    # A single matrix product computes all the pairwise cosine similarities
+    similarities = vectors @ vectors.T
+
+    selected = [int(np.argmax(relevance))]
+    redundancy = similarities[selected[0]].copy()
+    available = np.ones(len(vectors), dtype=bool)
+    available[selected[0]] = False
+
+    while len(selected) < min(top_k, len(vectors)):
+        scores = lambda_mult * relevance - (1 - lambda_mult) * redundancy
+        scores[~available] = -np.inf
+        index = int(np.argmax(scores))
+        selected.append(index)
+        available[index] = False
+        np.maximum(redundancy, similarities[index], out=redundancy)
+
+    return selected
+
 
 @component
 class QdrantEmbeddingRetriever:
@@ -43,6 +177,10 @@ class QdrantEmbeddingRetriever:
         return_embedding: bool = False,
         filter_policy: Union[str, FilterPolicy] = FilterPolicy.REPLACE,
         score_threshold: Optional[float] = None,
+        cache_config: Optional[Dict[str, Any]] = None,
+        mmr: bool = False,
+        mmr_lambda: float = 0.5,
+        mmr_fetch_k: Optional[int] = None,
     ):
         """
         Create a QdrantEmbeddingRetriever component.
@@ -57,44 +195,76 @@ class QdrantEmbeddingRetriever:
             Score of the returned result might be higher or smaller than the threshold
              depending on the `similarity` function specified in the Document Store.
             E.g. for cosine similarity only higher scores will be returned.
-
-        :raises ValueError: If `document_store` is not an instance of `QdrantDocumentStore`.
+        :param cache_config:
+            If set, the results of `run()` are cached in memory, so that repeating a query with the same parameters
+            doesn't hit Qdrant again. Supported keys are `max_size` (maximum number of cached queries, defaults
+            to 1000) and `ttl_seconds` (lifetime of a cached result, defaults to 300). Pass an empty dictionary to
+            use the defaults. Defaults to None, which disables caching.
+        :param mmr: Whether to diversify the retrieved documents using Maximal Marginal Relevance (MMR).
+            If `True`, `mmr_fetch_k` candidates are retrieved from Qdrant and `top_k` of them are selected,
+            balancing their similarity to the query against their similarity to the documents already selected.
+        :param mmr_lambda: Trade-off between relevance and diversity used by MMR, between 0 and 1.
+            1 only considers relevance, 0 only considers diversity.
+        :param mmr_fetch_k: Number of candidates retrieved from Qdrant when `mmr` is `True`.
+            Defaults to `max(3 * top_k, 50)`.
+
+        :raises ValueError: If `document_store` is not an instance of `QdrantDocumentStore`,
+            or if `mmr_lambda` is not between 0 and 1.
         """
 
         if not isinstance(document_store, QdrantDocumentStore):
             msg = "document_store must be an instance of QdrantDocumentStore"
             raise ValueError(msg)
 
+        if not 0 <= mmr_lambda <= 1:
+            msg = "mmr_lambda must be between 0 and 1"
+            raise ValueError(msg)
+
         self._document_store = document_store
         self._filters = filters
         self._top_k = top_k
         self._scale_score = scale_score
         self._return_embedding = return_embedding
         self._filter_policy = (
-            filter_policy if isinstance(filter_policy, FilterPolicy) else FilterPolicy.from_str(filter_policy)
+            filter_policy if isinstance(filter_policy, FilterPolicy) else _filter_policy_from_str(filter_policy)
         )
         self._score_threshold = score_threshold
+        self._cache_config = cache_config
+        self._cache = QueryCache(**cache_config) if cache_config is not None else None
+        self._to_dict_cache: Optional[Dict[str, Any]] = None
+        # Resolved once so that `run()` doesn't have to look up every default on each call
+        self._defaults = (self._top_k, self._scale_score, self._return_embedding, self._score_threshold)
+        self._mmr = mmr
+        self._mmr_lambda = mmr_lambda
+        self._mmr_fetch_k = mmr_fetch_k
 
     def to_dict(self) -> Dict[str, Any]:
         """
         Serializes the component to a dictionary.
 
+        The dictionary is built on the first call only, later calls return a copy of it.
+
         :returns:
             Dictionary with serialized data.
         """
-        d = default_to_dict(
-            self,
-            document_store=self._document_store,
-            filters=self._filters,
-            top_k=self._top_k,
-            filter_policy=self._filter_policy.value,
-            scale_score=self._scale_score,
-            return_embedding=self._return_embedding,
-            score_threshold=self._score_threshold,
-        )
-        d["init_parameters"]["document_store"] = self._document_store.to_dict()
-
-        return d
+        if self._to_dict_cache is None:
+            d = default_to_dict(
+                self,
+                document_store=self._document_store,
+                filters=self._filters,
+                top_k=self._top_k,
+                filter_policy=self._filter_policy.value,
+                scale_score=self._scale_score,
+                return_embedding=self._return_embedding,
+                score_threshold=self._score_threshold,
+                cache_config=self._cache_config,
+                mmr=self._mmr,
+                mmr_lambda=self._mmr_lambda,
+                mmr_fetch_k=self._mmr_fetch_k,
+            )
+            d["init_parameters"]["document_store"] = self._document_store.to_dict()
+            self._to_dict_cache = d
+        return copy.deepcopy(self._to_dict_cache)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "QdrantEmbeddingRetriever":
@@ -108,9 +278,19 @@ class QdrantEmbeddingRetriever:
         """
         document_store = QdrantDocumentStore.from_dict(data["init_parameters"]["document_store"])
         data["init_parameters"]["document_store"] = document_store
-        data["init_parameters"]["filter_policy"] = FilterPolicy.from_str(data["init_parameters"]["filter_policy"])
+        data["init_parameters"]["filter_policy"] = _filter_policy_from_str(data["init_parameters"]["filter_policy"])
         return default_from_dict(cls, data)
 
+    def get_cache_stats(self) -> Optional[Dict[str, int]]:
+        """
+        Returns the statistics of the query cache.
+
+        :returns:
+            A dictionary with the number of `hits`, `misses`, `evictions` and the current `size` of the cache,
+            or None if caching is disabled.
+        """
+        return self._cache.stats() if self._cache is not None else None
+
     @component.output_types(documents=List[Document])
     def run(
         self,
@@ -124,7 +304,7 @@ class QdrantEmbeddingRetriever:
         """
         Run the Embedding Retriever on the given input data.
 
-        :param query_embedding: Embedding of the query.
+        :param query_embedding: Embedding of the query. NumPy arrays are accepted as well.
         :param filters: A dictionary with filters to narrow down the search space.
         :param top_k: The maximum number of documents to return.
         :param scale_score: Whether to scale the scores of the retrieved documents or not.
@@ -134,18 +314,162 @@ class QdrantEmbeddingRetriever:
             The retrieved documents.
 
         """
-        filters = apply_filter_policy(self._filter_policy, self._filters, filters)
+        query_embedding = _to_float_list(query_embedding)
+        filters, (top_k, scale_score, return_embedding, score_threshold) = _resolve_run_params(
+            self, filters, (top_k, scale_score, return_embedding, score_threshold)
+        )
+
+        cache_key = None
+        if self._cache is not None:
+            cache_key = QueryCache.make_key(
+                query_embedding, filters, top_k, scale_score, return_embedding, score_threshold
+            )
+            cached_docs = self._cache.get(cache_key)
+            if cached_docs is not None:
+                return {"documents": cached_docs}
+
+        filters = _to_qdrant_filters(filters)
+        if self._mmr:
+            docs = self._query_with_mmr(
+                query_embedding=query_embedding,
+                filters=filters,
+                top_k=top_k,
+                scale_score=scale_score,
+                return_embedding=return_embedding,
+                score_threshold=score_threshold,
+            )
+        else:
+            docs = self._document_store._query_by_embedding(
+                query_embedding=query_embedding,
+                filters=filters,
+                top_k=top_k,
+                scale_score=scale_score,
+                return_embedding=return_embedding,
+                score_threshold=score_threshold,
+            )
+
+        if self._cache is not None and cache_key is not None:
+            self._cache.put(cache_key, docs)
+
+        return {"documents": docs}
+
+    def run_batch(
+        self,
+        query_embeddings: List[List[float]],
+        filters: Optional[Union[Dict[str, Any], models.Filter]] = None,
+        top_k: Optional[int] = None,
+        scale_score: Optional[bool] = None,
+        return_embedding: Optional[bool] = None,
+        score_threshold: Optional[float] = None,
+    ):
+        """
+        Run the Embedding Retriever for several query embeddings at once.
+
+        All queries are sent to Qdrant in a single `search_batch` request, which saves one round-trip per query
+        compared to calling `run()` repeatedly. When a cache is configured, the queries found in the cache are
+        answered from it and only the others are sent to Qdrant. With `mmr` enabled, every query needs its own
+        candidate selection, so the queries are run one by one.
+
+        :param query_embeddings: Embeddings of the queries. NumPy arrays are accepted as well.
+        :param filters: A dictionary with filters to narrow down the search space of every query.
+        :param top_k: The maximum number of documents to return per query.
+        :param scale_score: Whether to scale the scores of the retrieved documents or not.
+        :param return_embedding: Whether to return the embedding of the retrieved Documents.
+        :param score_threshold: A minimal score threshold for the result.
+        :returns:
+            A dictionary containing the retrieved documents with the following structure:
+            - documents: One list of retrieved Documents for each query, in the same order as `query_embeddings`.
+        """
+        query_embeddings = [_to_float_list(query_embedding) for query_embedding in query_embeddings]
+        filters, (top_k, scale_score, return_embedding, score_threshold) = _resolve_run_params(
+            self, filters, (top_k, scale_score, return_embedding, score_threshold)
+        )
+
+        docs: List[List[Document]] = [[] for _ in query_embeddings]
+        cache_keys: List[Optional[bytes]] = [None for _ in query_embeddings]
+        # Indexes of the queries that must be sent to Qdrant, cache hits are served directly
+        pending = list(range(len(query_embeddings)))
+        if self._cache is not None:
+            pending = []
+            for index, query_embedding in enumerate(query_embeddings):
+                cache_key = QueryCache.make_key(
+                    query_embedding, filters, top_k, scale_score, return_embedding, score_threshold
+                )
+                cache_keys[index] = cache_key
+                cached_docs = self._cache.get(cache_key)
+                if cached_docs is not None:
+                    docs[index] = cached_docs
+                else:
+                    pending.append(index)
+
+        if not pending:
+            return {"documents": docs}
+
+        filters = _to_qdrant_filters(filters)
+        if self._mmr:
+            results = [
+                self._query_with_mmr(
+                    query_embedding=query_embeddings[index],
+                    filters=filters,
+                    top_k=top_k,
+                    scale_score=scale_score,
+                    return_embedding=return_embedding,
+                    score_threshold=score_threshold,
+                )
+                for index in pending
+            ]
+        else:
+            results = self._document_store._query_by_embedding_batch(
+                query_embeddings=[query_embeddings[index] for index in pending],
+                filters=filters,
+                top_k=top_k,
+                scale_score=scale_score,
+                return_embedding=return_embedding,
+                score_threshold=score_threshold,
+            )
+
+        for index, result in zip(pending, results):
+            docs[index] = result
+            pending_key = cache_keys[index]
+            if self._cache is not None and pending_key is not None:
+                self._cache.put(pending_key, result)
 
-        docs = self._document_store._query_by_embedding(
+        return {"documents": docs}
+
+    def _query_with_mmr(
+        self,
+        query_embedding: List[float],
+        filters: Optional[Union[Dict[str, Any], models.Filter]],
+        top_k: int,
+        scale_score: bool,
+        return_embedding: bool,
+        score_threshold: Optional[float],
+    ) -> List[Document]:
+        """
+        Retrieves `mmr_fetch_k` candidates with their embeddings and selects `top_k` of them using MMR.
+        """
+        fetch_k = self._mmr_fetch_k if self._mmr_fetch_k is not None else max(3 * top_k, 50)
+        candidates = self._document_store._query_by_embedding(
             query_embedding=query_embedding,
             filters=filters,
-            top_k=top_k or self._top_k,
-            scale_score=scale_score or self._scale_score,
-            return_embedding=return_embedding or self._return_embedding,
-            score_threshold=score_threshold or self._score_threshold,
+            top_k=max(fetch_k, top_k),
+            scale_score=scale_score,
+            return_embedding=True,
+            score_threshold=score_threshold,
         )
 
-        return {"documents": docs}
+        embeddings = [doc.embedding for doc in candidates if doc.embedding is not None]
+        if len(candidates) <= top_k or len(embeddings) < len(candidates):
+            # Nothing to choose from, or documents stored without embeddings: keep the Qdrant ranking
+            docs = candidates[:top_k]
+        else:
+            selected = _maximal_marginal_relevance(query_embedding, embeddings, top_k, self._mmr_lambda)
+            docs = [candidates[i] for i in selected]
+
+        if not return_embedding:
+            for doc in docs:
+                doc.embedding = None
+        return docs
 
 
 @component
@@ -184,6 +508,7 @@ class QdrantSparseEmbeddingRetriever:
         return_embedding: bool = False,
         filter_policy: Union[str, FilterPolicy] = FilterPolicy.REPLACE,
         score_threshold: Optional[float] = None,
+        cache_config: Optional[Dict[str, Any]] = None,
     ):
         """
         Create a QdrantSparseEmbeddingRetriever component.
@@ -198,6 +523,11 @@ class QdrantSparseEmbeddingRetriever:
             Score of the returned result might be higher or smaller than the threshold
              depending on the Distance function used.
             E.g. for cosine similarity only higher scores will be returned.
+        :param cache_config:
+            If set, the results of `run()` are cached in memory, so that repeating a query with the same parameters
+            doesn't hit Qdrant again. Supported keys are `max_size` (maximum number of cached queries, defaults
+            to 1000) and `ttl_seconds` (lifetime of a cached result, defaults to 300). Pass an empty dictionary to
+            use the defaults. Defaults to None, which disables caching.
 
         :raises ValueError: If `document_store` is not an instance of `QdrantDocumentStore`.
         """
@@ -212,30 +542,39 @@ class QdrantSparseEmbeddingRetriever:
         self._scale_score = scale_score
         self._return_embedding = return_embedding
         self._filter_policy = (
-            filter_policy if isinstance(filter_policy, FilterPolicy) else FilterPolicy.from_str(filter_policy)
+            filter_policy if isinstance(filter_policy, FilterPolicy) else _filter_policy_from_str(filter_policy)
         )
         self._score_threshold = score_threshold
+        self._cache_config = cache_config
+        self._cache = QueryCache(**cache_config) if cache_config is not None else None
+        self._to_dict_cache: Optional[Dict[str, Any]] = None
+        # Resolved once so that `run()` doesn't have to look up every default on each call
+        self._defaults = (self._top_k, self._scale_score, self._return_embedding, self._score_threshold)
 
     def to_dict(self) -> Dict[str, Any]:
         """
         Serializes the component to a dictionary.
 
+        The dictionary is built on the first call only, later calls return a copy of it.
+
         :returns:
             Dictionary with serialized data.
         """
-        d = default_to_dict(
-            self,
-            document_store=self._document_store,
-            filters=self._filters,
-            top_k=self._top_k,
-            scale_score=self._scale_score,
-            filter_policy=self._filter_policy.value,
-            return_embedding=self._return_embedding,
-            score_threshold=self._score_threshold,
-        )
-        d["init_parameters"]["document_store"] = self._document_store.to_dict()
-
-        return d
+        if self._to_dict_cache is None:
+            d = default_to_dict(
+                self,
+                document_store=self._document_store,
+                filters=self._filters,
+                top_k=self._top_k,
+                scale_score=self._scale_score,
+                filter_policy=self._filter_policy.value,
+                return_embedding=self._return_embedding,
+                score_threshold=self._score_threshold,
+                cache_config=self._cache_config,
+            )
+            d["init_parameters"]["document_store"] = self._document_store.to_dict()
+            self._to_dict_cache = d
+        return copy.deepcopy(self._to_dict_cache)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "QdrantSparseEmbeddingRetriever":
@@ -249,9 +588,19 @@ class QdrantSparseEmbeddingRetriever:
         """
         document_store = QdrantDocumentStore.from_dict(data["init_parameters"]["document_store"])
         data["init_parameters"]["document_store"] = document_store
-        data["init_parameters"]["filter_policy"] = FilterPolicy.from_str(data["init_parameters"]["filter_policy"])
+        data["init_parameters"]["filter_policy"] = _filter_policy_from_str(data["init_parameters"]["filter_policy"])
         return default_from_dict(cls, data)
 
+    def get_cache_stats(self) -> Optional[Dict[str, int]]:
+        """
+        Returns the statistics of the query cache.
+
+        :returns:
+            A dictionary with the number of `hits`, `misses`, `evictions` and the current `size` of the cache,
+            or None if caching is disabled.
+        """
+        return self._cache.stats() if self._cache is not None else None
+
     @component.output_types(documents=List[Document])
     def run(
         self,
@@ -280,17 +629,38 @@ class QdrantSparseEmbeddingRetriever:
             The retrieved documents.
 
         """
-        filters = apply_filter_policy(self._filter_policy, self._filters, filters)
+        query_sparse_embedding = _normalize_sparse_embedding(query_sparse_embedding)
+        filters, (top_k, scale_score, return_embedding, score_threshold) = _resolve_run_params(
+            self, filters, (top_k, scale_score, return_embedding, score_threshold)
+        )
 
+        cache_key = None
+        if self._cache is not None:
+            cache_key = QueryCache.make_key(
+                (query_sparse_embedding.indices, query_sparse_embedding.values),
+                filters,
+                top_k,
+                scale_score,
+                return_embedding,
+                score_threshold,
+            )
+            cached_docs = self._cache.get(cache_key)
+            if cached_docs is not None:
+                return {"documents": cached_docs}
+
+        filters = _to_qdrant_filters(filters)
         docs = self._document_store._query_by_sparse(
             query_sparse_embedding=query_sparse_embedding,
             filters=filters,
-            top_k=top_k or self._top_k,
-            scale_score=scale_score or self._scale_score,
-            return_embedding=return_embedding or self._return_embedding,
-            score_threshold=score_threshold or self._score_threshold,
+            top_k=top_k,
+            scale_score=scale_score,
+            return_embedding=return_embedding,
+            score_threshold=score_threshold,
         )
 
+        if self._cache is not None and cache_key is not None:
+            self._cache.put(cache_key, docs)
+
         return {"documents": docs}
 
 
@@ -335,6 +705,7 @@ class QdrantHybridRetriever:
         return_embedding: bool = False,
         filter_policy: Union[str, FilterPolicy] = FilterPolicy.REPLACE,
         score_threshold: Optional[float] = None,
+        cache_config: Optional[Dict[str, Any]] = None,
     ):
         """
         Create a QdrantHybridRetriever component.
@@ -348,6 +719,11 @@ class QdrantHybridRetriever:
             Score of the returned result might be higher or smaller than the threshold
              depending on the Distance function used.
             E.g. for cosine similarity only higher scores will be returned.
+        :param cache_config:
+            If set, the results of `run()` are cached in memory, so that repeating a query with the same parameters
+            doesn't hit Qdrant again. Supported keys are `max_size` (maximum number of cached queries, defaults
+            to 1000) and `ttl_seconds` (lifetime of a cached result, defaults to 300). Pass an empty dictionary to
+            use the defaults. Defaults to None, which disables caching.
 
         :raises ValueError: If 'document_store' is not an instance of QdrantDocumentStore.
         """
@@ -361,26 +737,36 @@ class QdrantHybridRetriever:
         self._top_k = top_k
         self._return_embedding = return_embedding
         self._filter_policy = (
-            filter_policy if isinstance(filter_policy, FilterPolicy) else FilterPolicy.from_str(filter_policy)
+            filter_policy if isinstance(filter_policy, FilterPolicy) else _filter_policy_from_str(filter_policy)
         )
         self._score_threshold = score_threshold
+        self._cache_config = cache_config
+        self._cache = QueryCache(**cache_config) if cache_config is not None else None
+        self._to_dict_cache: Optional[Dict[str, Any]] = None
+        # Resolved once so that `run()` doesn't have to look up every default on each call
+        self._defaults = (self._top_k, self._return_embedding, self._score_threshold)
 
     def to_dict(self) -> Dict[str, Any]:
         """
         Serializes the component to a dictionary.
 
+        The dictionary is built on the first call only, later calls return a copy of it.
+
         :returns:
             Dictionary with serialized data.
         """
-        return default_to_dict(
-            self,
-            document_store=self._document_store.to_dict(),
-            filters=self._filters,
-            top_k=self._top_k,
-            filter_policy=self._filter_policy.value,
-            return_embedding=self._return_embedding,
-            score_threshold=self._score_threshold,
-        )
+        if self._to_dict_cache is None:
+            self._to_dict_cache = default_to_dict(
+                self,
+                document_store=self._document_store.to_dict(),
+                filters=self._filters,
+                top_k=self._top_k,
+                filter_policy=self._filter_policy.value,
+                return_embedding=self._return_embedding,
+                score_threshold=self._score_threshold,
+                cache_config=self._cache_config,
+            )
+        return copy.deepcopy(self._to_dict_cache)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "QdrantHybridRetriever":
@@ -394,9 +780,19 @@ class QdrantHybridRetriever:
         """
         document_store = QdrantDocumentStore.from_dict(data["init_parameters"]["document_store"])
         data["init_parameters"]["document_store"] = document_store
-        data["init_parameters"]["filter_policy"] = FilterPolicy.from_str(data["init_parameters"]["filter_policy"])
+        data["init_parameters"]["filter_policy"] = _filter_policy_from_str(data["init_parameters"]["filter_policy"])
         return default_from_dict(cls, data)
 
+    def get_cache_stats(self) -> Optional[Dict[str, int]]:
+        """
+        Returns the statistics of the query cache.
+
+        :returns:
+            A dictionary with the number of `hits`, `misses`, `evictions` and the current `size` of the cache,
+            or None if caching is disabled.
+        """
+        return self._cache.stats() if self._cache is not None else None
+
     @component.output_types(documents=List[Document])
     def run(
         self,
@@ -410,7 +806,7 @@ class QdrantHybridRetriever:
         """
         Run the Sparse Embedding Retriever on the given input data.
 
-        :param query_embedding: Dense embedding of the query.
+        :param query_embedding: Dense embedding of the query. NumPy arrays are accepted as well.
         :param query_sparse_embedding: Sparse embedding of the query.
         :param filters: Filters applied to the retrieved Documents. The way runtime filters are applied depends on
                         the `filter_policy` chosen at retriever initialization. See init method docstring for more
@@ -425,15 +821,72 @@ class QdrantHybridRetriever:
             The retrieved documents.
 
         """
-        filters = apply_filter_policy(self._filter_policy, self._filters, filters)
+        query_embedding = _to_float_list(query_embedding)
+        query_sparse_embedding = _normalize_sparse_embedding(query_sparse_embedding)
+        filters, (top_k, return_embedding, score_threshold) = _resolve_run_params(
+            self, filters, (top_k, return_embedding, score_threshold)
+        )
 
+        cache_key = None
+        if self._cache is not None:
+            cache_key = QueryCache.make_key(
+                (query_embedding, query_sparse_embedding.indices, query_sparse_embedding.values),
+                filters,
+                top_k,
+                return_embedding,
+                score_threshold,
+            )
+            cached_docs = self._cache.get(cache_key)
+            if cached_docs is not None:
+                return {"documents": cached_docs}
+
+        filters = _to_qdrant_filters(filters)
         docs = self._document_store._query_hybrid(
             query_embedding=query_embedding,
             query_sparse_embedding=query_sparse_embedding,
             filters=filters,
-            top_k=top_k or self._top_k,
-            return_embedding=return_embedding or self._return_embedding,
-            score_threshold=score_threshold or self._score_threshold,
+            top_k=top_k,
+            return_embedding=return_embedding,
+            score_threshold=score_threshold,
         )
 
+        if self._cache is not None and cache_key is not None:
+            self._cache.put(cache_key, docs)
+
         return {"documents": docs}
+
+    @component.output_types(documents=List[Document])
+    async def run_async(
+        self,
+        query_embedding: List[float],
+        query_sparse_embedding: SparseEmbedding,
+        filters: Optional[Union[Dict[str, Any], models.Filter]] = None,
+        top_k: Optional[int] = None,
+        return_embedding: Optional[bool] = None,
+        score_threshold: Optional[float] = None,
+    ):
+        """
+        Asynchronously run the Hybrid Retriever on the given input data.
+
+        The dense and sparse searches are already sent to Qdrant as a single batch request by `run()`.
+        This method runs it in the event loop's default executor, so that the surrounding event loop can make
+        progress on other work while waiting for Qdrant to respond.
+
+        The parameters are the same as for `run()`.
+
+        :returns:
+            The retrieved documents.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(
+                self.run,
+                query_embedding=query_embedding,
+                query_sparse_embedding=query_sparse_embedding,
+                filters=filters,
+                top_k=top_k,
+                return_embedding=return_embedding,
+                score_threshold=score_threshold,
+            ),
+        )
@@ -137,6 +137,57 @@ def convert_filters_to_qdrant(
     return qdrant_filter
 
 
+def simplify_qdrant_filter(qdrant_filter: Optional[models.Filter]) -> Optional[models.Filter]:
+    """
+    Removes redundant clauses from a Qdrant Filter, so that Qdrant has fewer conditions to evaluate.
+
+    Duplicated conditions are dropped from the `must`, `should` and `must_not` clauses, and nested Filters
+    only made of `must` (or `should`) conditions are merged into the `must` (or `should`) clause containing them.
+
+    :param qdrant_filter: the Filter to simplify.
+    :returns: a simplified copy of the Filter, or the Filter itself if there is nothing to simplify.
+    """
+    if qdrant_filter is None:
+        return None
+
+    simplified = {
+        clause: _simplify_clause(getattr(qdrant_filter, clause), clause) for clause in ("must", "should", "must_not")
+    }
+    if all(simplified[clause] == getattr(qdrant_filter, clause) for clause in simplified):
+        return qdrant_filter
+    return models.Filter(**simplified, min_should=qdrant_filter.min_should)
+
+
+def _simplify_clause(
+    conditions: Optional[Union[List[models.Condition], models.Condition]], clause: str
+) -> Optional[Union[List[models.Condition], models.Condition]]:
+    if conditions is None:
+        return None
+    if not isinstance(conditions, list):
+        conditions = [conditions]
+
+    simplified: List[models.Condition] = []
+    for condition in conditions:
+        simplified_condition = simplify_qdrant_filter(condition) if isinstance(condition, models.Filter) else condition
+        for nested_condition in _mergeable_conditions(simplified_condition, clause) or [simplified_condition]:
+            if nested_condition not in simplified:
+                simplified.append(nested_condition)
+    return simplified
+
+
+def _mergeable_conditions(condition: models.Condition, clause: str) -> Optional[List[models.Condition]]:
+    # A negation of negations isn't a negation, so only `must` and `should` clauses can absorb nested Filters
+    if not isinstance(condition, models.Filter) or clause == "must_not" or condition.min_should is not None:
+        return None
+    other_clauses = {"must", "should", "must_not"} - {clause}
+    if any(getattr(condition, other_clause) for other_clause in other_clauses):
+        return None
+    nested_conditions = getattr(condition, clause)
+    if nested_conditions is None or isinstance(nested_conditions, list):
+        return nested_conditions
+    return [nested_conditions]
+
+
 def build_filters_for_repeated_operators(
     must_clauses,
     should_clauses,
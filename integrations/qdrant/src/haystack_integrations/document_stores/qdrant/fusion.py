@@ -0,0 +1,73 @@
+from typing import Dict, List
+
+import numpy as np
+from qdrant_client.http import models as rest
+
+# The constant mitigates the impact of high rankings by outlier systems.
+# Same value as the one used by `qdrant_client.hybrid.fusion.reciprocal_rank_fusion`.
+RRF_RANKING_CONSTANT = 2
+
+
+def reciprocal_rank_fusion(responses: List[List[rest.ScoredPoint]], limit: int = 10) -> List[rest.ScoredPoint]:
+    """
+    Fuses several rankings of points using Reciprocal Rank Fusion.
+
+    This is a NumPy-based equivalent of `qdrant_client.hybrid.fusion.reciprocal_rank_fusion`: the point at position
+    `i` of a response contributes `1 / (RRF_RANKING_CONSTANT + i)` to its fused score, points with equal scores keep
+    the order in which they first appear, and the `score` of the returned points is set to their fused score.
+
+    Point IDs are mapped to consecutive integers with a dictionary, since hashing strings is faster in Python than
+    sorting them with `np.unique`. Accumulating and sorting the scores is then done by NumPy.
+
+    :param responses: Rankings of points to fuse, each sorted by decreasing relevance.
+    :param limit: Maximum number of points to return.
+    :returns: The fused points, sorted by decreasing fused score.
+    """
+    if limit <= 0:
+        return []
+
+    positions: Dict[rest.ExtendedPointId, int] = {}
+    unique_points: List[rest.ScoredPoint] = []
+    inverse: List[int] = []
+    for response in responses:
+        for point in response:
+            position = positions.get(point.id)
+            if position is None:
+                position = positions[point.id] = len(unique_points)
+                unique_points.append(point)
+            inverse.append(position)
+
+    if not unique_points:
+        return []
+
+    ranks = np.concatenate([np.arange(len(response)) for response in responses])
+    scores = np.bincount(inverse, weights=1.0 / (RRF_RANKING_CONSTANT + ranks), minlength=len(unique_points))
+
+    order = _top_k_indices(scores, limit)
+
+    fused = []
+    for i in order:
+        point = unique_points[i]
+        point.score = float(scores[i])
+        fused.append(point)
+    return fused
+
+
+def _top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Returns the indices of the `k` highest `scores`, sorted by decreasing score.
+
+    Equal scores keep the order of their indices, like a stable sort of the whole array would. When `k` is much
+    smaller than the number of scores, only the scores reaching the `k`-th highest one are sorted, which turns the
+    O(n log n) sort into an O(n + k log k) selection.
+    """
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k >= len(scores):
+        # A stable sort keeps points with equal scores in order of first appearance
+        return np.argsort(-scores, kind="stable")
+
+    kth_highest = np.partition(scores, len(scores) - k)[len(scores) - k]
+    # Keep every score tied with the k-th highest one, so that ties are broken by index and not by the partitioning
+    candidates = np.flatnonzero(scores >= kth_highest)
+    return candidates[np.argsort(-scores[candidates], kind="stable")][:k]
@@ -43,6 +43,7 @@ def test_to_dict():
             "write_batch_size": 100,
             "scroll_size": 10000,
             "payload_fields_to_index": None,
+            "embedding_dtype": "float32",
         },
     }
 
@@ -74,6 +75,7 @@ def test_from_dict():
                 "write_batch_size": 1000,
                 "scroll_size": 10000,
                 "payload_fields_to_index": None,
+                "embedding_dtype": "float16",
             },
         }
     )
@@ -104,5 +106,6 @@ def test_from_dict():
             document_store.scroll_size == 10000,
             document_store.api_key == Secret.from_env_var("ENV_VAR", strict=False),
             document_store.payload_fields_to_index is None,
+            document_store.embedding_dtype == "float16",
         ]
     )
@@ -1,5 +1,5 @@
 from typing import List
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 from haystack import Document
@@ -36,6 +36,26 @@ class TestQdrantDocumentStore(CountDocumentsTest, WriteDocumentsTest, DeleteDocu
             QdrantDocumentStore(location=":memory:", use_sparse_embeddings=True)
             mocked_qdrant.assert_not_called()
 
+    def test_client_is_shared_between_stores(self):
+        with patch("haystack_integrations.document_stores.qdrant.document_store.qdrant_client") as mocked_qdrant, patch(
+            "haystack_integrations.document_stores.qdrant.document_store.QdrantDocumentStore._set_up_collection"
+        ) as mocked_set_up:
+            mocked_qdrant.QdrantClient.side_effect = lambda **_kwargs: Mock()
+            store = QdrantDocumentStore(url="http://testhost", index="first")
+            same_server = QdrantDocumentStore(url="http://testhost", index="second")
+            other_server = QdrantDocumentStore(url="http://otherhost", index="first")
+
+            assert store.client is same_server.client
+            assert store.client is not other_server.client
+            assert mocked_qdrant.QdrantClient.call_count == 2
+            # Each store still sets up its own collection
+            assert mocked_set_up.call_count == 3
+
+    def test_in_memory_client_is_not_shared(self):
+        first = QdrantDocumentStore(":memory:", use_sparse_embeddings=False)
+        second = QdrantDocumentStore(":memory:", use_sparse_embeddings=False)
+        assert first.client is not second.client
+
     def assert_documents_are_equal(self, received: List[Document], expected: List[Document]):
         """
         Assert that two lists of Documents are equal.
@@ -71,6 +91,19 @@ class TestQdrantDocumentStore(CountDocumentsTest, WriteDocumentsTest, DeleteDocu
         assert hasattr(sparse_config[SPARSE_VECTORS_NAME], "modifier")
         assert sparse_config[SPARSE_VECTORS_NAME].modifier == rest.Modifier.IDF
 
+    def test_embedding_dtype_configuration(self):
+        document_store = QdrantDocumentStore(":memory:", recreate_index=True, embedding_dtype="float16")
+
+        vectors_config = document_store.client.get_collection("Document").config.params.vectors
+        assert vectors_config.datatype == rest.Datatype.FLOAT16
+
+        document_store = QdrantDocumentStore(":memory:", recreate_index=True)
+        assert document_store.client.get_collection("Document").config.params.vectors.datatype is None
+
+    def test_embedding_dtype_invalid(self):
+        with pytest.raises(ValueError):
+            QdrantDocumentStore(":memory:", embedding_dtype="int8")
+
     def test_query_hybrid(self, generate_sparse_embedding):
         document_store = QdrantDocumentStore(location=":memory:", use_sparse_embeddings=True)
 
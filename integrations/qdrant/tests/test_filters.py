@@ -5,6 +5,7 @@ from haystack import Document
 from haystack.testing.document_store import FilterDocumentsTest
 from haystack.utils.filters import FilterError
 from haystack_integrations.document_stores.qdrant import QdrantDocumentStore
+from haystack_integrations.document_stores.qdrant.filters import simplify_qdrant_filter
 from qdrant_client.http import models
 
 
@@ -215,3 +216,23 @@ class TestQdrantStoreBaseTests(FilterDocumentsTest):
 
     @pytest.mark.skip(reason="Cannot distinguish errors yet")
     def test_missing_top_level_operator_key(self, document_store, filterable_docs): ...
+
+
+def test_simplify_qdrant_filter():
+    article = models.FieldCondition(key="meta.type", match=models.MatchValue(value="article"))
+    rating = models.FieldCondition(key="meta.rating", range=models.Range(gte=3))
+    genre = models.FieldCondition(key="meta.genre", match=models.MatchValue(value="economy"))
+
+    qdrant_filter = models.Filter(must=[models.Filter(must=[article, rating]), models.Filter(must=[article])])
+    assert simplify_qdrant_filter(qdrant_filter) == models.Filter(must=[article, rating])
+
+    qdrant_filter = models.Filter(should=[genre, models.Filter(should=[genre, article])], must_not=[rating, rating])
+    assert simplify_qdrant_filter(qdrant_filter) == models.Filter(should=[genre, article], must_not=[rating])
+
+    # Filters mixing clauses and negations of negations are kept
+    qdrant_filter = models.Filter(
+        must=[models.Filter(should=[article, genre])], must_not=[models.Filter(must_not=[rating])]
+    )
+    assert simplify_qdrant_filter(qdrant_filter) is qdrant_filter
+
+    assert simplify_qdrant_filter(None) is None
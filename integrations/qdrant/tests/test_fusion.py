@@ -0,0 +1,50 @@
+import random
+
+import numpy as np
+import pytest
+from haystack_integrations.document_stores.qdrant.fusion import _top_k_indices, reciprocal_rank_fusion
+from qdrant_client.http import models as rest
+from qdrant_client.hybrid.fusion import reciprocal_rank_fusion as qdrant_reciprocal_rank_fusion
+
+
+def _points(ids):
+    return [rest.ScoredPoint(id=_id, version=0, score=0.0) for _id in ids]
+
+
+def test_reciprocal_rank_fusion():
+    dense = _points(["a", "b", "c"])
+    sparse = _points(["c", "d", "a"])
+
+    fused = reciprocal_rank_fusion([dense, sparse], limit=3)
+
+    assert [point.id for point in fused] == ["a", "c", "b"]
+    assert fused[0].score == pytest.approx(1 / 2 + 1 / 4)
+    assert fused[1].score == pytest.approx(1 / 4 + 1 / 2)
+    assert fused[2].score == pytest.approx(1 / 3)
+
+
+def test_reciprocal_rank_fusion_empty():
+    assert reciprocal_rank_fusion([[], []], limit=10) == []
+    assert reciprocal_rank_fusion([_points([1, 2])], limit=0) == []
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_reciprocal_rank_fusion_matches_qdrant_client(seed):
+    rng = random.Random(seed)  # noqa: S311
+    ids = list(range(200))
+    dense_ids = rng.sample(ids, 100)
+    sparse_ids = rng.sample(ids, 100)
+
+    expected = qdrant_reciprocal_rank_fusion([_points(dense_ids), _points(sparse_ids)], limit=20)
+    fused = reciprocal_rank_fusion([_points(dense_ids), _points(sparse_ids)], limit=20)
+
+    assert [point.id for point in fused] == [point.id for point in expected]
+    assert [point.score for point in fused] == pytest.approx([point.score for point in expected])
+
+
+@pytest.mark.parametrize("k", [0, 1, 3, 5, 10, 20])
+def test_top_k_indices(k):
+    scores = np.array([0.1, 0.5, 0.5, 0.3, 0.5, 0.2, 0.3, 0.0, 0.5, 0.1])
+
+    expected = np.argsort(-scores, kind="stable")[:k]
+    assert _top_k_indices(scores, k).tolist() == expected.tolist()
@@ -1,6 +1,9 @@
+import asyncio
+from datetime import datetime, timezone
 from typing import List
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
+import numpy as np
 import pytest
 from haystack.dataclasses import Document, SparseEmbedding
 from haystack.document_stores.types import FilterPolicy
@@ -13,7 +16,9 @@ from haystack_integrations.components.retrievers.qdrant import (
     QdrantHybridRetriever,
     QdrantSparseEmbeddingRetriever,
 )
+from haystack_integrations.components.retrievers.qdrant.retriever import _to_qdrant_filters
 from haystack_integrations.document_stores.qdrant import QdrantDocumentStore
+from qdrant_client.http import models
 
 
 class TestQdrantRetriever(FilterableDocsFixtureMixin):
@@ -78,6 +83,7 @@ class TestQdrantRetriever(FilterableDocsFixtureMixin):
                         "write_batch_size": 100,
                         "scroll_size": 10000,
                         "payload_fields_to_index": None,
+                        "embedding_dtype": "float32",
                     },
                 },
                 "filters": None,
@@ -86,6 +92,10 @@ class TestQdrantRetriever(FilterableDocsFixtureMixin):
                 "scale_score": False,
                 "return_embedding": False,
                 "score_threshold": None,
+                "cache_config": None,
+                "mmr": False,
+                "mmr_lambda": 0.5,
+                "mmr_fetch_k": None,
             },
         }
 
@@ -178,6 +188,217 @@ class TestQdrantRetriever(FilterableDocsFixtureMixin):
         )["documents"]
         assert len(results) == 2
 
+    def test_run_with_cache(self):
+        mock_store = Mock(spec=QdrantDocumentStore)
+        mock_store._query_by_embedding.return_value = [Document(content="Test doc")]
+        retriever = QdrantEmbeddingRetriever(document_store=mock_store, cache_config={"max_size": 10})
+
+        first = retriever.run(query_embedding=[0.5, 0.7])["documents"]
+        second = retriever.run(query_embedding=[0.5, 0.7])["documents"]
+        retriever.run(query_embedding=[0.5, 0.7], top_k=3)
+
+        assert mock_store._query_by_embedding.call_count == 2
+        assert first == second
+        assert second[0] is not first[0]
+        assert retriever.get_cache_stats() == {"hits": 1, "misses": 2, "evictions": 0, "size": 2}
+
+    def test_run_batch(self, filterable_docs: List[Document]):
+        document_store = QdrantDocumentStore(location=":memory:", index="Boi", use_sparse_embeddings=False)
+        document_store.write_documents(filterable_docs)
+        retriever = QdrantEmbeddingRetriever(document_store=document_store)
+        query_embeddings = [_random_embeddings(768), _random_embeddings(768)]
+
+        results = retriever.run_batch(query_embeddings=query_embeddings, top_k=5, scale_score=True)["documents"]
+
+        assert len(results) == 2
+        for query_embedding, batch_docs in zip(query_embeddings, results):
+            docs = retriever.run(query_embedding=query_embedding, top_k=5, scale_score=True)["documents"]
+            assert [(doc.id, doc.score) for doc in batch_docs] == [(doc.id, doc.score) for doc in docs]
+
+    def test_run_batch_sends_single_request(self):
+        mock_store = Mock(spec=QdrantDocumentStore)
+        mock_store._query_by_embedding_batch.return_value = [[Document(content="first")], []]
+        retriever = QdrantEmbeddingRetriever(document_store=mock_store, top_k=3)
+
+        res = retriever.run_batch(query_embeddings=[[0.5, 0.7], np.array([0.1, 0.2])])
+
+        mock_store._query_by_embedding_batch.assert_called_once()
+        call_args = mock_store._query_by_embedding_batch.call_args[1]
+        assert call_args["query_embeddings"] == [[0.5, 0.7], pytest.approx([0.1, 0.2])]
+        assert call_args["top_k"] == 3
+        mock_store._query_by_embedding.assert_not_called()
+        assert res["documents"] == [[Document(content="first")], []]
+
+    def test_run_batch_with_cache(self):
+        mock_store = Mock(spec=QdrantDocumentStore)
+        mock_store._query_by_embedding.return_value = [Document(content="cached")]
+        mock_store._query_by_embedding_batch.return_value = [[Document(content="new")]]
+        retriever = QdrantEmbeddingRetriever(document_store=mock_store, cache_config={})
+        retriever.run(query_embedding=[0.5, 0.7])
+
+        res = retriever.run_batch(query_embeddings=[[0.5, 0.7], [0.1, 0.2]])
+
+        # Only the query missing from the cache is sent to Qdrant
+        assert mock_store._query_by_embedding_batch.call_args[1]["query_embeddings"] == [[0.1, 0.2]]
+        assert res["documents"] == [[Document(content="cached")], [Document(content="new")]]
+        assert retriever.run(query_embedding=[0.1, 0.2])["documents"] == [Document(content="new")]
+        assert mock_store._query_by_embedding.call_count == 1
+
+    def test_run_batch_with_mmr(self):
+        mock_store = Mock(spec=QdrantDocumentStore)
+        mock_store._query_by_embedding.side_effect = lambda **_kwargs: [
+            Document(content="relevant", embedding=[0.99, 0.14]),
+            Document(content="relevant duplicate", embedding=[1.0, 0.0]),
+            Document(content="different", embedding=[0.0, 1.0]),
+        ]
+        retriever = QdrantEmbeddingRetriever(document_store=mock_store, mmr=True, mmr_lambda=0.5)
+
+        res = retriever.run_batch(query_embeddings=[[0.8, 0.6], [0.8, 0.6]], top_k=2)
+
+        assert mock_store._query_by_embedding.call_count == 2
+        mock_store._query_by_embedding_batch.assert_not_called()
+        assert [[doc.content for doc in docs] for docs in res["documents"]] == [["relevant", "different"]] * 2
+
+    def test_run_falsy_runtime_params(self):
+        mock_store = Mock(spec=QdrantDocumentStore)
+        mock_store._query_by_embedding.return_value = []
+        retriever = QdrantEmbeddingRetriever(
+            document_store=mock_store, top_k=5, scale_score=True, return_embedding=True, score_threshold=0.5
+        )
+
+        retriever.run(
+            query_embedding=[0.5, 0.7], top_k=0, scale_score=False, return_embedding=False, score_threshold=0.0
+        )
+
+        call_args = mock_store._query_by_embedding.call_args[1]
+        assert call_args["top_k"] == 0
+        assert call_args["scale_score"] is False
+        assert call_args["return_embedding"] is False
+        assert call_args["score_threshold"] == 0.0
+
+    def test_run_compiles_filters(self):
+        mock_store = Mock(spec=QdrantDocumentStore)
+        mock_store._query_by_embedding.return_value = []
+        filters = {"field": "meta.name", "operator": "==", "value": "name_0"}
+        retriever = QdrantEmbeddingRetriever(document_store=mock_store, filters=filters)
+
+        retriever.run(query_embedding=[0.5, 0.7])
+        retriever.run(query_embedding=[0.1, 0.2])
+
+        first_call, second_call = mock_store._query_by_embedding.call_args_list
+        assert isinstance(first_call[1]["filters"], models.Filter)
+        assert first_call[1]["filters"] is second_call[1]["filters"]
+
+    def test_to_qdrant_filters(self):
+        filters = {
+            "operator": "AND",
+            "conditions": [
+                {"field": "meta.number", "operator": ">", "value": 2},
+                {"field": "meta.chapter", "operator": "in", "value": ["intro", "abstract"]},
+            ],
+        }
+        qdrant_filter = _to_qdrant_filters(filters)
+        assert isinstance(qdrant_filter, models.Filter)
+        # Key order doesn't matter
+        assert _to_qdrant_filters(dict(reversed(filters.items()))) is qdrant_filter
+
+        assert _to_qdrant_filters(None) is None
+        assert _to_qdrant_filters(qdrant_filter) is qdrant_filter
+
+    def test_to_qdrant_filters_not_json_serializable(self):
+        filters = {"field": "meta.date", "operator": "==", "value": datetime(2024, 1, 1, tzinfo=timezone.utc)}
+        with patch(
+            "haystack_integrations.components.retrievers.qdrant.retriever.convert_filters_to_qdrant", return_value=None
+        ) as mock_convert:
+            _to_qdrant_filters(filters)
+            _to_qdrant_filters(filters)
+
+        assert mock_convert.call_count == 2
+        mock_convert.assert_called_with(filters)
+
+    def test_run_with_numpy_embedding(self):
+        mock_store = Mock(spec=QdrantDocumentStore)
+        mock_store._query_by_embedding.return_value = [Document(content="Test doc")]
+        retriever = QdrantEmbeddingRetriever(document_store=mock_store)
+
+        retriever.run(query_embedding=np.array([0.5, 0.25], dtype=np.float64))
+
+        query_embedding = mock_store._query_by_embedding.call_args[1]["query_embedding"]
+        assert query_embedding == [0.5, 0.25]
+        assert isinstance(query_embedding, list)
+
+    def test_to_dict_computed_once(self):
+        document_store = QdrantDocumentStore(location=":memory:", index="test", use_sparse_embeddings=False)
+        retriever = QdrantEmbeddingRetriever(document_store=document_store)
+
+        with patch.object(document_store, "to_dict", wraps=document_store.to_dict) as mock_to_dict:
+            first = retriever.to_dict()
+            first["init_parameters"]["top_k"] = 1
+            second = retriever.to_dict()
+
+        mock_to_dict.assert_called_once()
+        assert second["init_parameters"]["top_k"] == 10
+        assert second["init_parameters"]["document_store"]["init_parameters"]["index"] == "test"
+
+    def test_init_filter_policy_from_str(self):
+        document_store = Mock(spec=QdrantDocumentStore)
+        retriever = QdrantEmbeddingRetriever(document_store=document_store, filter_policy="MERGE")
+        assert retriever._filter_policy == FilterPolicy.MERGE
+        with pytest.raises(ValueError):
+            QdrantEmbeddingRetriever(document_store=document_store, filter_policy="unknown")
+
+    def test_init_invalid_mmr_lambda(self):
+        with pytest.raises(ValueError):
+            QdrantEmbeddingRetriever(document_store=Mock(spec=QdrantDocumentStore), mmr=True, mmr_lambda=1.5)
+
+    def test_run_with_mmr(self):
+        mock_store = Mock(spec=QdrantDocumentStore)
+        mock_store._query_by_embedding.return_value = [
+            Document(content="relevant", embedding=[0.99, 0.14], score=0.87),
+            Document(content="relevant duplicate", embedding=[1.0, 0.0], score=0.8),
+            Document(content="different", embedding=[0.0, 1.0], score=0.6),
+            Document(content="irrelevant", embedding=[-1.0, 0.0], score=-0.8),
+        ]
+        retriever = QdrantEmbeddingRetriever(document_store=mock_store, mmr=True, mmr_lambda=0.5, mmr_fetch_k=4)
+
+        res = retriever.run(query_embedding=[0.8, 0.6], top_k=2)
+
+        call_args = mock_store._query_by_embedding.call_args[1]
+        assert call_args["top_k"] == 4
+        assert call_args["return_embedding"] is True
+        assert [doc.content for doc in res["documents"]] == ["relevant", "different"]
+        assert all(doc.embedding is None for doc in res["documents"])
+
+    def test_run_with_mmr_only_relevance(self):
+        mock_store = Mock(spec=QdrantDocumentStore)
+        mock_store._query_by_embedding.return_value = [
+            Document(content="relevant", embedding=[0.99, 0.14]),
+            Document(content="relevant duplicate", embedding=[1.0, 0.0]),
+            Document(content="different", embedding=[0.0, 1.0]),
+        ]
+        retriever = QdrantEmbeddingRetriever(document_store=mock_store, mmr=True, mmr_lambda=1.0, return_embedding=True)
+
+        res = retriever.run(query_embedding=[0.8, 0.6], top_k=2)
+
+        assert mock_store._query_by_embedding.call_args[1]["top_k"] == 50
+        assert [doc.content for doc in res["documents"]] == ["relevant", "relevant duplicate"]
+        assert res["documents"][0].embedding == [0.99, 0.14]
+
+    def test_run_with_mmr_top_k_zero(self):
+        mock_store = Mock(spec=QdrantDocumentStore)
+        mock_store._query_by_embedding.return_value = [
+            Document(content=f"doc {i}", embedding=[1.0, i / 10]) for i in range(5)
+        ]
+        retriever = QdrantEmbeddingRetriever(document_store=mock_store, mmr=True)
+
+        res = retriever.run(query_embedding=[0.8, 0.6], top_k=0)
+
+        assert res["documents"] == []
+
+    def test_get_cache_stats_without_cache(self):
+        retriever = QdrantEmbeddingRetriever(document_store=Mock(spec=QdrantDocumentStore))
+        assert retriever.get_cache_stats() is None
+
     def test_run_with_sparse_activated(self, filterable_docs: List[Document]):
         document_store = QdrantDocumentStore(location=":memory:", index="Boi", use_sparse_embeddings=True)
 
@@ -259,6 +480,7 @@ class TestQdrantSparseEmbeddingRetriever(FilterableDocsFixtureMixin):
                         "write_batch_size": 100,
                         "scroll_size": 10000,
                         "payload_fields_to_index": None,
+                        "embedding_dtype": "float32",
                     },
                 },
                 "filters": None,
@@ -267,6 +489,7 @@ class TestQdrantSparseEmbeddingRetriever(FilterableDocsFixtureMixin):
                 "return_embedding": False,
                 "filter_policy": "replace",
                 "score_threshold": None,
+                "cache_config": None,
             },
         }
 
@@ -316,6 +539,29 @@ class TestQdrantSparseEmbeddingRetriever(FilterableDocsFixtureMixin):
         for document in results:
             assert document.sparse_embedding
 
+    def test_run_falsy_runtime_params(self):
+        mock_store = Mock(spec=QdrantDocumentStore)
+        mock_store._query_by_sparse.return_value = []
+        retriever = QdrantSparseEmbeddingRetriever(document_store=mock_store, top_k=5, score_threshold=0.5)
+
+        retriever.run(query_sparse_embedding=SparseEmbedding(indices=[0], values=[0.1]), top_k=0, score_threshold=0.0)
+
+        call_args = mock_store._query_by_sparse.call_args[1]
+        assert call_args["top_k"] == 0
+        assert call_args["score_threshold"] == 0.0
+
+    def test_run_with_numpy_sparse_embedding(self):
+        mock_store = Mock(spec=QdrantDocumentStore)
+        mock_store._query_by_sparse.return_value = [Document(content="Test doc")]
+        retriever = QdrantSparseEmbeddingRetriever(document_store=mock_store)
+
+        retriever.run(query_sparse_embedding=SparseEmbedding(indices=np.array([0, 5]), values=np.array([0.5, 0.25])))
+
+        query_sparse_embedding = mock_store._query_by_sparse.call_args[1]["query_sparse_embedding"]
+        assert query_sparse_embedding.indices == [0, 5]
+        assert query_sparse_embedding.values == [0.5, 0.25]
+        assert isinstance(query_sparse_embedding.values, list)
+
 
 class TestQdrantHybridRetriever:
     def test_init_default(self):
@@ -380,6 +626,7 @@ class TestQdrantHybridRetriever:
                         "write_batch_size": 100,
                         "scroll_size": 10000,
                         "payload_fields_to_index": None,
+                        "embedding_dtype": "float32",
                     },
                 },
                 "filters": None,
@@ -387,6 +634,7 @@ class TestQdrantHybridRetriever:
                 "filter_policy": "replace",
                 "return_embedding": True,
                 "score_threshold": None,
+                "cache_config": None,
             },
         }
 
@@ -436,3 +684,55 @@ class TestQdrantHybridRetriever:
         assert res["documents"][0].content == "Test doc"
         assert res["documents"][0].embedding == [0.1, 0.2]
         assert res["documents"][0].sparse_embedding == sparse_embedding
+
+    def test_run_falsy_runtime_params(self):
+        mock_store = Mock(spec=QdrantDocumentStore)
+        mock_store._query_hybrid.return_value = []
+        retriever = QdrantHybridRetriever(
+            document_store=mock_store, top_k=5, return_embedding=True, score_threshold=0.5
+        )
+
+        retriever.run(
+            query_embedding=[0.5, 0.7],
+            query_sparse_embedding=SparseEmbedding(indices=[0], values=[0.1]),
+            top_k=0,
+            return_embedding=False,
+            score_threshold=0.0,
+        )
+
+        call_args = mock_store._query_hybrid.call_args[1]
+        assert call_args["top_k"] == 0
+        assert call_args["return_embedding"] is False
+        assert call_args["score_threshold"] == 0.0
+
+    def test_run_with_cache(self):
+        mock_store = Mock(spec=QdrantDocumentStore)
+        mock_store._query_hybrid.return_value = [Document(content="Test doc")]
+        retriever = QdrantHybridRetriever(document_store=mock_store, cache_config={})
+        sparse_embedding = SparseEmbedding(indices=[0], values=[0.1])
+
+        retriever.run(query_embedding=[0.5, 0.7], query_sparse_embedding=sparse_embedding)
+        res = retriever.run(query_embedding=[0.5, 0.7], query_sparse_embedding=sparse_embedding)
+        retriever.run(query_embedding=[0.5, 0.7], query_sparse_embedding=SparseEmbedding(indices=[1], values=[0.1]))
+
+        assert mock_store._query_hybrid.call_count == 2
+        assert res["documents"][0].content == "Test doc"
+        assert retriever.get_cache_stats()["hits"] == 1
+
+    def test_run_async(self):
+        mock_store = Mock(spec=QdrantDocumentStore)
+        mock_store._query_hybrid.return_value = [Document(content="Test doc")]
+        retriever = QdrantHybridRetriever(document_store=mock_store)
+
+        res = asyncio.run(
+            retriever.run_async(
+                query_embedding=[0.5, 0.7],
+                query_sparse_embedding=SparseEmbedding(indices=[0, 5], values=[0.1, 0.7]),
+                top_k=3,
+            )
+        )
+
+        call_args = mock_store._query_hybrid.call_args[1]
+        assert call_args["query_embedding"] == [0.5, 0.7]
+        assert call_args["top_k"] == 3
+        assert res["documents"][0].content == "Test doc"